@@ -3,6 +3,7 @@ import os
 import sys
 
 # Third party imports
+from gi.repository import GLib  # type: ignore
 
 # Setup path for local imports
 sys.path.insert(0, os.path.dirname(__file__))
@@ -29,6 +30,9 @@ from modules import (
 )
 from modules.bar.widgets.player_expanded import ExpandedPlayerWindow
 from modules.bar.widgets.datetime import CalendarPopup
+from modules.bar.widgets.cpu import CpuPopup
+from services.notification_history import NotificationHistoryService
+from services.startup_report import measure, print_report
 from services.wallpaper_processor import on_depth_wall_toggle, on_wallpaper_change
 from user_options import user_options
 
@@ -39,6 +43,8 @@ css_manager = CssManager.get_default()
 
 
 WallpaperService.get_default()
+# Start recording notification history before any window is opened
+NotificationHistoryService.get_default()
 if options.wallpaper.wallpaper_path is None or not os.path.exists(
     options.wallpaper.wallpaper_path
 ):
@@ -106,19 +112,41 @@ css_manager.apply_css(
 
 # # Widget Initialization
 # Single instance widgets (created only once on monitor 0)
-CalendarPopup(0)  # Calendar popup - single instance
-ExpandedPlayerWindow(0)  # Media player popup - single instance
-ControlCenter(0)  # Control center - single instance
+with measure("CalendarPopup"):
+    CalendarPopup(0)  # Calendar popup - single instance
+with measure("ExpandedPlayerWindow"):
+    ExpandedPlayerWindow(0)  # Media player popup - single instance
+with measure("CpuPopup"):
+    CpuPopup(0)  # CPU details popup - single instance
+with measure("ControlCenter"):
+    ControlCenter(0)  # Control center - single instance, content built on first open
+
+# Notification popups are shown once on the focused (or configured) monitor,
+# unless mirroring to every monitor is enabled
+with measure("NotificationPopup"):
+    if user_options.notifications.mirror_popups:
+        for monitor in range(utils.get_n_monitors()):
+            NotificationPopup(monitor)
+    else:
+        NotificationPopup()
 
 # Per-monitor widgets
 for monitor in range(utils.get_n_monitors()):
-    DateWidget(monitor)
-    TimeWidget(monitor)
-    Depth(monitor)
-    Bar(monitor)
-    NotificationPopup(monitor)
-    CornerAll(monitor)
-    Osd(monitor)
-
-Settings()
-Powermenu()
+    with measure(f"Desktop widgets ({monitor})"):
+        DateWidget(monitor)
+        TimeWidget(monitor)
+        Depth(monitor)
+    with measure(f"Bar ({monitor})"):
+        Bar(monitor)
+    with measure(f"Corners ({monitor})"):
+        CornerAll(monitor)
+
+with measure("Osd"):
+    Osd()  # Single OSD, shown on the focused monitor
+with measure("Settings"):
+    Settings()
+with measure("Powermenu"):
+    Powermenu()
+
+# Printed once the main loop is idle (set FLUX_STARTUP_REPORT=1)
+GLib.idle_add(print_report)
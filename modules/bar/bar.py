@@ -24,7 +24,7 @@ class CentreBar(widgets.Box):
                 css_classes=["usage"],
                 spacing=9,
                 child=[
-                    CpuUsage(),
+                    CpuUsage(monitor_id),
                     RamUsage(),
                 ],
             )
@@ -1,22 +1,178 @@
+from gi.repository import GLib
 from ignis import widgets
-from ignis.services.fetch import FetchService
-from ignis.utils import Poll
+from ignis.window_manager import WindowManager
+
+from services.system_metrics import SystemMetricsService
 
 from ...shared_widgets.circular_progress import CircularProgressBar
+from ...shared_widgets.history_graph import HistoryGraph
+
+metrics = SystemMetricsService.get_default()
+window_manager = WindowManager.get_default()
+
+
+def toggle_cpu_window(monitor: int):
+    """Toggle or switch the CPU details window to the specified monitor"""
+    window = window_manager.get_window("ignis_CPU_0")
+
+    if window and hasattr(window, "visible") and hasattr(window, "monitor"):
+        if window.visible and window.monitor == monitor:
+            window.close()
+        else:
+            if window.monitor != monitor:
+                window.set_monitor(monitor)
+            window.toggle()
+
+
+class CoreBar(widgets.Box):
+    def __init__(self, core: int):
+        self._core = core
+        self._scale = widgets.Scale(
+            min=0,
+            max=100,
+            vertical=True,
+            inverted=True,
+            vexpand=True,
+            sensitive=False,
+            css_classes=["cpu-core-scale"],
+        )
+        super().__init__(
+            vertical=True,
+            css_classes=["cpu-core"],
+            child=[
+                self._scale,
+                widgets.Label(label=str(core), css_classes=["cpu-core-label"]),
+            ],
+        )
+
+    def set_value(self, value: float) -> None:
+        self._scale.value = value
+        self.set_tooltip_text(f"CPU {self._core}: {value:.0f}%")
 
-fetch = FetchService.get_default()
+
+class CpuDetails(widgets.Box):
+    def __init__(self):
+        self._cores = [CoreBar(i) for i in range(metrics.core_count)]
+        self._graph = HistoryGraph(
+            metrics.cpu_history,
+            max_value=100,
+            size=(320, 80),
+            css_classes=["cpu-history-graph"],
+        )
+
+        super().__init__(
+            vertical=True,
+            spacing=8,
+            css_classes=["cpu-details"],
+            child=[
+                widgets.Box(
+                    child=[
+                        widgets.Label(
+                            label="CPU",
+                            css_classes=["cpu-details-title"],
+                            hexpand=True,
+                            halign="start",
+                        ),
+                        widgets.Label(
+                            label=metrics.bind(
+                                "cpu_percent", lambda value: f"{value:.0f}%"
+                            ),
+                            css_classes=["cpu-details-percent"],
+                        ),
+                    ],
+                ),
+                self._graph,
+                widgets.Box(
+                    homogeneous=True,
+                    spacing=2,
+                    css_classes=["cpu-cores"],
+                    child=self._cores,
+                ),
+            ],
+        )
+
+    def refresh(self) -> None:
+        for bar, history in zip(self._cores, metrics.core_history):
+            bar.set_value(history.last())
+        self._graph.queue_draw()
+
+
+class CpuPopup(widgets.Window):
+    def __init__(self, monitor_id: int = 0):
+        self._details = CpuDetails()
+        self.revealer = widgets.Revealer(
+            css_classes=["cpu-revealer"],
+            transition_type="slide_down",
+            transition_duration=300,
+            reveal_child=False,
+            child=self._details,
+        )
+
+        super().__init__(
+            namespace="ignis_CPU_0",  # Always use monitor 0 for single instance
+            monitor=0,  # Start on monitor 0, will be switched as needed
+            css_classes=["cpu-popup"],
+            anchor=["top", "left", "bottom", "right"],
+            exclusivity="normal",
+            visible=False,
+            child=widgets.Box(
+                vertical=True,
+                hexpand=True,
+                vexpand=True,
+                child=[
+                    widgets.CenterBox(
+                        hexpand=True,
+                        start_widget=widgets.Button(
+                            hexpand=True,
+                            css_classes=["unset"],
+                            on_click=lambda x: self.close(),
+                        ),
+                        center_widget=self.revealer,
+                        end_widget=widgets.Button(
+                            hexpand=True,
+                            css_classes=["unset"],
+                            on_click=lambda x: self.close(),
+                        ),
+                    ),
+                    widgets.Button(
+                        vexpand=True,
+                        hexpand=True,
+                        css_classes=["unset"],
+                        on_click=lambda x: self.close(),
+                    ),
+                ],
+            ),
+        )
+
+        # Only redraw the graph and core bars while the popup is shown
+        metrics.connect("sampled", lambda x: self.visible and self._details.refresh())
+
+    def toggle(self):
+        if not self.visible:
+            self._details.refresh()
+            self.visible = True
+            self.revealer.reveal_child = True
+        else:
+            self.close()
+
+    def close(self):
+        self.revealer.reveal_child = False
+        # Hide window after animation completes
+        GLib.timeout_add(350, lambda: setattr(self, "visible", False) or False)
 
 
 class CpuUsage(widgets.Box):
-    def __init__(self) -> None:
+    def __init__(self, monitor_id: int = 0) -> None:
         super().__init__(
             css_classes=["bar-cpu"],
             spacing=4,
             vexpand=True,
             hexpand=True,
+            tooltip_text=metrics.bind("cpu_temp", lambda temp: f"CPU Temp: {temp}°C"),
         )
 
-        Poll(5000, lambda _: self.set_tooltip_text(f"CPU Temp: {fetch.cpu_temp}°C"))
+        self._monitor_id = monitor_id
+
         self._cpu_progress = CircularProgressBar(
             line_width=2,
             size=(23, 23),
@@ -25,7 +181,7 @@ class CpuUsage(widgets.Box):
             end_angle=630,
             css_classes=["progress-cpu"],
             max_value=100,
-            value=0,
+            value=metrics.bind("cpu_percent"),
         )
 
         self._cpu_icon = widgets.Label(
@@ -46,52 +202,14 @@ class CpuUsage(widgets.Box):
             valign="center",
             halign="start",
             css_classes=["cpu-label"],
-            label="0%",
+            label=metrics.bind("cpu_percent", lambda value: f"{value:.0f}%"),
         )
 
-        self.append(self._cpu_overlay)
-        self.append(self._cpu_label)
-
-        # Track previous CPU stats for calculation
-        self._prev_idle = 0
-        self._prev_total = 0
-
-        # Poll CPU usage every 2 seconds
-        self._poll = Poll(
-            timeout=2000,
-            callback=self._update_cpu_usage,
+        self.append(
+            widgets.EventBox(
+                css_classes=["unset"],
+                on_click=lambda x: toggle_cpu_window(self._monitor_id),
+                child=[self._cpu_overlay],
+            )
         )
-
-    def _get_cpu_stats(self):
-        with open("/proc/stat", "r") as f:
-            line = f.readline().strip()
-
-        cpu_times = [int(x) for x in line.split()[1:]]
-        idle_time = cpu_times[3]
-        total_time = sum(cpu_times)
-
-        return idle_time, total_time
-
-    def _update_cpu_usage(self, poll_instance) -> float:
-        idle_time, total_time = self._get_cpu_stats()
-
-        # Calculate CPU usage percentage
-        if self._prev_total != 0:
-            idle_diff = idle_time - self._prev_idle
-            total_diff = total_time - self._prev_total
-
-            if total_diff > 0:
-                cpu_percent = (1 - idle_diff / total_diff) * 100
-            else:
-                cpu_percent = 0
-        else:
-            cpu_percent = 0
-
-        self._prev_idle = idle_time
-        self._prev_total = total_time
-
-        # Update UI
-        setattr(self._cpu_progress, "value", cpu_percent)
-        self._cpu_label.label = f"{cpu_percent:.0f}%"
-
-        return cpu_percent
+        self.append(self._cpu_label)
@@ -2,11 +2,13 @@ import calendar
 import datetime
 
 from gi.repository import GLib
-from ignis import utils, widgets
-from ignis.variable import Variable
+from ignis import widgets
 from ignis.window_manager import WindowManager
 
+from services.clock import ClockService
+
 window_manager = WindowManager.get_default()
+clock = ClockService.get_default()
 
 def toggle_calendar_window(monitor: int):
     """Toggle or switch the calendar window to the specified monitor"""
@@ -230,27 +232,7 @@ class Datetime(widgets.Box):
 
         self._monitor_id = monitor_id
 
-        # Cache datetime formatting to avoid repeated string operations
-        self._last_formatted = ""
-        self._last_minute = -1
-        
-        def get_formatted_time():
-            now = datetime.datetime.now()
-            current_minute = now.minute
-            
-            # Only update formatting if minute changed to save CPU
-            if current_minute != self._last_minute:
-                self._last_formatted = now.strftime("<b>%I:%M</b> • %A, %-d %b")
-                self._last_minute = current_minute
-            
-            return self._last_formatted
-
-        self.current_time = Variable(
-            value=utils.Poll(
-                1000,
-                lambda x: get_formatted_time(),
-            ).bind("output")
-        )
+        self.current_time = clock.format("<b>%I:%M</b> • %A, %-d %b")
 
         self.time_button = widgets.EventBox(
             css_classes=["unset"],
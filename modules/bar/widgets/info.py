@@ -1,7 +1,10 @@
-from ignis import utils, widgets
+from ignis import widgets
 from ignis.services.fetch import FetchService
 
+from services.system_metrics import SystemMetricsService
+
 fetch = FetchService.get_default()
+metrics = SystemMetricsService.get_default()
 
 
 class Info(widgets.CenterBox):
@@ -31,7 +34,7 @@ class Info(widgets.CenterBox):
         )
         self.ramUsage = widgets.Scale(
             css_classes=["usage-slider"],
-            # value=fetch.bind("mem_used", lambda x: (x / fetch.mem_total) * 100),
+            value=metrics.bind("mem_percent"),
             sensitive=False,
             hexpand=True,
             min=0,
@@ -39,11 +42,6 @@ class Info(widgets.CenterBox):
             on_change=lambda x: print(x.value),
         )
 
-        utils.Poll(
-            1000,
-            lambda _: self.ramUsage.set_value(fetch.mem_used / fetch.mem_total * 100),
-        )
-
         self.start_widget = widgets.Box(
             hexpand=True,
             vertical=False,
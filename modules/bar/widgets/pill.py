@@ -1,7 +1,4 @@
-import datetime
-import subprocess
-
-from ignis import utils, widgets
+from ignis import widgets
 from ignis.options import options
 from ignis.services.audio import AudioService
 from ignis.services.bluetooth import BluetoothService
@@ -12,6 +9,10 @@ from ignis.services.upower import UPowerDevice, UPowerService
 from ignis.variable import Variable
 from ignis.window_manager import WindowManager
 
+from services.clock import ClockService
+from services.pressure import PressureService
+from services.process_watcher import ProcessWatcherService
+
 from ..indicator_icon import IndicatorIcon, NetworkIndicatorIcon
 from .player_expanded import toggle_expanded_player
 from .datetime import toggle_calendar_window  
@@ -23,50 +24,27 @@ recorder = RecorderService.get_default()
 audio = AudioService.get_default()
 bluetooth = BluetoothService.get_default()
 upower = UPowerService.get_default()
+pressure = PressureService.get_default()
+clock = ClockService.get_default()
+process_watcher = ProcessWatcherService.get_default()
 
 window_manager = WindowManager.get_default()
 
-current_time = Variable(
-    value=utils.Poll(1000, lambda x: datetime.datetime.now().strftime("%H:%M")).bind(
-        "output"
-    )
-)
-
-
-def check_recording_processes(*args) -> bool:
-    """Check if any screen recording processes are running"""
-    recording_processes = [
-        "wf-recorder",
-        "wl-screenrec",
-        "gpu-screen-recorder",
-        "obs",
-        "ffmpeg",
-        "grim",
-    ]
-
-    try:
-        # Get list of all running processes
-        result = subprocess.run(
-            ["ps", "ax", "-o", "comm="], capture_output=True, text=True, check=True
-        )
+current_time = clock.format("%H:%M")
 
-        running_processes = result.stdout.strip().split("\n")
+recording_status = Variable(value=False)
 
-        # Check if any recording process is running
-        for process in recording_processes:
-            if any(process in running_proc for running_proc in running_processes):
-                return True
 
-        return False
+def update_recording_status(*args) -> None:
+    """Recording if a known recorder process or Ignis's own recorder is running"""
+    recording = bool(process_watcher.running) or recorder.active
+    if recording_status.value != recording:
+        recording_status.value = recording
 
-    except subprocess.CalledProcessError:
-        # If ps command fails, assume no recording
-        return False
 
-
-recording_status = Variable(
-    value=utils.Poll(1000, check_recording_processes).bind("output")
-)
+process_watcher.connect("notify::running", update_recording_status)
+recorder.connect("notify::active", update_recording_status)
+update_recording_status()
 
 
 class WifiIcon(NetworkIndicatorIcon):
@@ -105,6 +83,18 @@ class RecorderIcon(IndicatorIcon):
         self.add_css_class("active")
 
 
+class MemoryPressureIcon(IndicatorIcon):
+    def __init__(self):
+        super().__init__(
+            image="dialog-warning-symbolic",
+            css_classes=["pressure-indicator"],
+            visible=pressure.bind("memory_stalled"),
+            tooltip_text=pressure.bind(
+                "memory_pressure", lambda value: f"Memory pressure: {value:.1f}%"
+            ),
+        )
+
+
 class VolumeIcon(IndicatorIcon):
     def __init__(self):
         super().__init__(
@@ -185,6 +175,7 @@ class StatusPill(widgets.Button):
                 spacing=5,
                 child=[
                     RecorderIcon(),
+                    MemoryPressureIcon(),
                     BluetoothIcon(),
                     WifiIcon(),
                     EthernetIcon(),
@@ -1,19 +1,31 @@
 from ignis import widgets
-from ignis.services.fetch import FetchService
-from ignis.utils import Poll
+
+from services.pressure import PressureService
+from services.system_metrics import SystemMetricsService
 
 from ...shared_widgets.circular_progress import CircularProgressBar
 
-fetch = FetchService.get_default()
+metrics = SystemMetricsService.get_default()
+pressure = PressureService.get_default()
 
 
 class RamUsage(widgets.Box):
     def __init__(self) -> None:
         super().__init__(
-            css_classes=["bar-ram"],
+            css_classes=pressure.bind(
+                "memory_stalled",
+                lambda stalled: ["bar-ram", "pressure"] if stalled else ["bar-ram"],
+            ),
             spacing=4,
             vexpand=True,
             hexpand=True,
+            # avg10 is only refreshed while stalled, so it is not shown otherwise
+            tooltip_text=pressure.bind_many(
+                ["memory_stalled", "memory_pressure"],
+                lambda stalled, value: f"Memory pressure: {value:.1f}%"
+                if stalled
+                else None,
+            ),
         )
 
         self._ram_progress = CircularProgressBar(
@@ -23,11 +35,9 @@ class RamUsage(widgets.Box):
             pie=True,
             end_angle=630,
             css_classes=["progress-ram"],
-            max_value=fetch.mem_total,
-            value=0,
+            max_value=metrics.bind("mem_total"),
+            value=metrics.bind("mem_used"),
         )
-        # Reduce polling frequency to save memory and CPU
-        Poll(2000, lambda x: self._ram_progress.set_value(fetch.mem_used))
 
         self._ram_icon = widgets.Label(
             css_classes=["ram-icon"],
@@ -47,14 +57,9 @@ class RamUsage(widgets.Box):
             valign="center",
             halign="start",
             css_classes=["ram-label"],
-        )
-        # Reduce polling frequency to save memory and CPU  
-        Poll(
-            2000,
-            lambda x: setattr(
-                self._ram_label,
-                "label",
-                f"{fetch.mem_used / 1024 / 1024:.1f}/{fetch.mem_total / 1024 / 1024:.1f} GB",
+            label=metrics.bind_many(
+                ["mem_used", "mem_total"],
+                lambda used, total: f"{used / 1024 / 1024:.1f}/{total / 1024 / 1024:.1f} GB",
             ),
         )
 
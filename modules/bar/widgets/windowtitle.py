@@ -1,5 +1,8 @@
+import functools
+import os
+
 from ignis import widgets
-from ignis.services.applications import ApplicationsService
+from ignis.services.applications import Application, ApplicationsService
 from ignis.services.hyprland import HyprlandService
 from ignis.services.niri import NiriService
 
@@ -12,29 +15,82 @@ def _truncate(text: str, size: int) -> str:
     return text if len(text) <= size else text[:size] + "…"
 
 
-def find_app_by_class(win_class: str):
-    """
-    Find application by window class using various search strategies
-    """
-    if not win_class:
-        return None
+def _normalize(name: str) -> str:
+    name = name.lower()
+    if name.endswith(".desktop"):
+        name = name[: -len(".desktop")]
+    return name.replace("_", " ").replace("-", " ").strip()
 
-    search_terms = [
-        win_class,
-        win_class.lower(),
-        win_class.replace("-", " "),
-        win_class.replace("_", " "),
-        win_class.split(".")[-1] if "." in win_class else win_class,
-    ]
 
-    for search_term in search_terms:
-        results = ApplicationsService.search(applications.apps, search_term)
-        if results:
-            return results[0]
+class AppIndex:
+    """
+    Maps window classes to applications with dictionary lookups.
 
-    return None
+    The index is built from app IDs, StartupWMClass, executables and names
+    the first time it is needed after the app list changes. Lookups are
+    memoized, so every bar shares one lookup per window class.
+    """
+
+    def __init__(self):
+        self._index: dict[str, Application] | None = None
+        applications.connect("notify::apps", lambda *_: self.invalidate())
+
+    def invalidate(self) -> None:
+        self._index = None
+        self.lookup.cache_clear()
+        get_app_info.cache_clear()
+
+    def _build(self) -> dict[str, Application]:
+        index: dict[str, Application] = {}
+        apps = applications.apps
+
+        # Earlier passes win: an explicit StartupWMClass beats a matching name
+        for app in apps:
+            wm_class = app.app.get_startup_wm_class()
+            if wm_class:
+                index.setdefault(_normalize(wm_class), app)
+        for app in apps:
+            if app.id:
+                app_id = _normalize(app.id)
+                index.setdefault(app_id, app)
+                index.setdefault(app_id.rsplit(".", 1)[-1], app)
+        for app in apps:
+            if app.executable:
+                index.setdefault(_normalize(os.path.basename(app.executable)), app)
+        for app in apps:
+            if app.name:
+                index.setdefault(_normalize(app.name), app)
+
+        return index
+
+    @functools.lru_cache(maxsize=128)
+    def lookup(self, win_class: str) -> Application | None:
+        if not win_class:
+            return None
+        if self._index is None:
+            self._index = self._build()
+
+        key = _normalize(win_class)
+        app = self._index.get(key) or self._index.get(key.rsplit(".", 1)[-1])
+        if app:
+            return app
+
+        # Last resort, memoized like the indexed lookups
+        results = ApplicationsService.search(applications.apps, win_class)
+        return results[0] if results else None
+
+
+app_index = AppIndex()
+
+
+def find_app_by_class(win_class: str) -> Application | None:
+    """
+    Find application by window class using the shared app index
+    """
+    return app_index.lookup(win_class)
 
 
+@functools.lru_cache(maxsize=64)
 def get_app_info(win_title: str, win_class: str):
     """
     Get window app info using Applications service for dynamic app detection
@@ -1,7 +1,10 @@
-from ignis import widgets
+from gi.repository import Gdk, Gtk
+from ignis import utils, widgets
 from ignis.services.hyprland import HyprlandService, HyprlandWorkspace
 from ignis.services.niri import NiriService, NiriWorkspace
 
+from services.monitors import get_monitor_connector
+
 hyprland = HyprlandService.get_default()
 niri = NiriService.get_default()
 
@@ -9,6 +12,11 @@ niri = NiriService.get_default()
 
 PERSISTENT_WORKSPACES = []
 
+# Scroll deltas are summed over this window before switching once
+SCROLL_WINDOW = 120  # ms
+# Touchpads report pixels; this many count as one wheel notch
+SCROLL_PIXELS_PER_STEP = 50.0
+
 # CUSTOM_LABELS = {
 #     1: "一",
 #     2: "二",
@@ -49,157 +57,320 @@ class WorkspaceSwitcher:
             niri.switch_to_workspace(workspace_id)
 
 
-def create_persistent_workspace_button(
-    workspace_id: int, is_active: bool = False, has_windows: bool = False
-) -> widgets.Button:
-    widget = widgets.Button(
-        css_classes=["workspace"],
-        on_click=lambda x: WorkspaceSwitcher.switch_to_persistent_workspace(
-            workspace_id
-        ),
-        child=widgets.Label(label=get_workspace_label(workspace_id)),
-    )
-
-    if is_active:
-        widget.add_css_class("active")
-    elif has_windows:
-        widget.add_css_class("occupied")
+class WorkspaceButton(widgets.Button):
+    """
+    A workspace button that is kept alive for as long as its workspace ID
+    exists, so switching workspaces only swaps CSS classes.
+    """
+
+    def __init__(self, workspace_id: int):
+        self.workspace_id = workspace_id
+        # Compositor workspace object, None for persistent placeholders
+        self.workspace: HyprlandWorkspace | NiriWorkspace | None = None
+        self._state = ""
+
+        super().__init__(
+            css_classes=["workspace"],
+            on_click=lambda x: self.__on_click(),
+            child=widgets.Label(label=get_workspace_label(workspace_id)),
+        )
+
+    def __on_click(self) -> None:
+        if self.workspace is not None:
+            self.workspace.switch_to()
+        else:
+            WorkspaceSwitcher.switch_to_persistent_workspace(self.workspace_id)
+
+    def set_state(self, state: str) -> None:
+        """Set one of the "active", "occupied" or "empty" CSS classes"""
+        if state == self._state:
+            return
+        if self._state:
+            self.remove_css_class(self._state)
+        self.add_css_class(state)
+        self._state = state
+
+
+def _scroll_targets(
+    connector: str | None,
+) -> tuple[list[tuple[int, HyprlandWorkspace | NiriWorkspace | None]], int | None]:
+    """Return the workspaces scrolling may reach on an output, and the active ID"""
+    if hyprland.is_available:
+        on_output = {
+            ws.id: ws
+            for ws in hyprland.workspaces
+            if ws.id > 0 and (connector is None or ws.monitor == connector)
+        }
+        elsewhere = {ws.id for ws in hyprland.workspaces} - on_output.keys()
+        targets: dict[int, HyprlandWorkspace | NiriWorkspace | None] = {
+            ws_id: None for ws_id in PERSISTENT_WORKSPACES if ws_id not in elsewhere
+        }
+        targets.update(on_output)
+
+        monitor = next(
+            (m for m in hyprland.monitors if m.name == connector),
+            None,
+        )
+        if monitor is not None:
+            active_id = monitor.active_workspace_id
+        else:
+            active_id = (
+                hyprland.active_workspace.id if hyprland.active_workspace else None
+            )
+        return sorted(targets.items(), key=lambda t: t[0]), active_id
+
+    if niri.is_available:
+        output = connector or niri.active_output
+        # Niri indices are per output and always end with one empty workspace
+        on_output = [ws for ws in niri.workspaces if ws.output == output]
+        active = next((ws.idx for ws in on_output if ws.is_active), None)
+        return sorted(((ws.idx, ws) for ws in on_output), key=lambda t: t[0]), active
+
+    return [], None
+
+
+def scroll_workspaces(steps: int, connector: str | None = None) -> None:
+    """
+    Switch ``steps`` workspaces forward (or back) on the output ``connector``,
+    clamped to the workspaces of that output.
+    """
+    targets, active_id = _scroll_targets(connector)
+    ids = [ws_id for ws_id, _ in targets]
+    if active_id not in ids:
+        return
+
+    index = max(0, min(ids.index(active_id) + steps, len(ids) - 1))
+    ws_id, workspace = targets[index]
+    if ws_id == active_id:
+        return
+
+    # Workspace objects switch on their own output even when it is not focused
+    if workspace is not None:
+        workspace.switch_to()
     else:
-        widget.add_css_class("empty")
+        WorkspaceSwitcher.switch_to_persistent_workspace(ws_id)
+
 
-    return widget
+class ScrollAccumulator:
+    """
+    Integrates scroll deltas over ``SCROLL_WINDOW`` ms and dispatches a single
+    workspace switch, so one touchpad gesture or fast wheel spin results in
+    one IPC call instead of dozens.
+    """
 
+    def __init__(self, widget: Gtk.Widget, connector: str | None = None):
+        self._connector = connector
+        self._delta = 0.0
+        self._timeout: utils.Timeout | None = None
+        self._reset_timeout: utils.Timeout | None = None
 
-def hyprland_workspace_button(workspace: HyprlandWorkspace) -> widgets.Button:
-    widget = widgets.Button(
-        css_classes=["workspace"],
-        on_click=lambda x: workspace.switch_to(),
-        child=widgets.Label(label=get_workspace_label(workspace.id)),
-    )
+        controller = Gtk.EventControllerScroll(
+            flags=Gtk.EventControllerScrollFlags.VERTICAL
+        )
+        controller.connect("scroll", self.__on_scroll)
+        widget.add_controller(controller)
+
+    def __on_scroll(
+        self, controller: Gtk.EventControllerScroll, dx: float, dy: float
+    ) -> bool:
+        if self._reset_timeout:
+            self._reset_timeout.cancel()
+            self._reset_timeout = None
+
+        if controller.get_unit() == Gdk.ScrollUnit.SURFACE:
+            dy /= SCROLL_PIXELS_PER_STEP
+        self._delta += dy
+
+        if self._timeout is None:
+            self._timeout = utils.Timeout(SCROLL_WINDOW, self.__dispatch)
+        return True
+
+    def __dispatch(self) -> None:
+        self._timeout = None
+        steps = int(self._delta)
+        # Keep the fractional remainder so slow touchpad scrolls still add up,
+        # but only while the gesture continues
+        self._delta -= steps
+        if self._delta:
+            self._reset_timeout = utils.Timeout(SCROLL_WINDOW, self.__reset)
+        if steps:
+            scroll_workspaces(steps, self._connector)
+
+    def __reset(self) -> None:
+        self._reset_timeout = None
+        self._delta = 0.0
+
+
+class WorkspaceRouter:
+    """
+    Routes compositor workspace events to the bars on the affected output.
+
+    Every event is reduced to a per-output signature; only bars whose
+    signature changed are synced, so a switch on one screen touches one bar.
+    """
+
+    def __init__(self):
+        self._views: dict[str | None, list["Workspaces"]] = {}
+        self._signatures: dict[str | None, tuple] = {}
+        self._monitors: dict[str, object] = {}
 
-    if workspace.id == hyprland.active_workspace.id:
-        widget.add_css_class("active")
+        if hyprland.is_available:
+            hyprland.connect("notify::workspaces", lambda *_: self.route())
+            hyprland.connect("notify::active-workspace", lambda *_: self.route())
+            hyprland.connect("notify::monitors", lambda *_: self.__watch_monitors())
+            self.__watch_monitors()
+        elif niri.is_available:
+            niri.connect("notify::workspaces", lambda *_: self.route())
+
+    def register(self, view: "Workspaces") -> None:
+        self._views.setdefault(view.connector, []).append(view)
+        self._signatures.pop(view.connector, None)
+        self.route()
+
+    def __watch_monitors(self) -> None:
+        # Each output shows its own active workspace, not only the focused one
+        for monitor in hyprland.monitors:
+            if self._monitors.get(monitor.name) is not monitor:
+                self._monitors[monitor.name] = monitor
+                monitor.connect("notify::active-workspace-id", lambda *_: self.route())
+        self.route()
+
+    def _snapshot(self) -> list[tuple[int, HyprlandWorkspace | NiriWorkspace, str, bool]]:
+        """Return (id, workspace, output, is_active) for every workspace"""
+        if hyprland.is_available:
+            active_ids = {
+                monitor.active_workspace_id for monitor in hyprland.monitors
+            }
+            return [
+                (ws.id, ws, ws.monitor, ws.id in active_ids)
+                for ws in hyprland.workspaces
+                if ws.id > 0
+            ]
+        elif niri.is_available:
+            return [
+                (ws.idx, ws, ws.output, ws.is_active)
+                for ws in niri.workspaces
+                if ws.idx > 0
+            ]
+        return []
+
+    def route(self) -> None:
+        snapshot = self._snapshot()
+        all_ids = {ws_id for ws_id, _, _, _ in snapshot}
+
+        for connector, views in self._views.items():
+            # Unknown connector: show every workspace, like a single-output setup
+            entries = [e for e in snapshot if connector is None or e[2] == connector]
+
+            # Hyprland IDs are global, Niri indices are per output
+            taken = all_ids if hyprland.is_available else {e[0] for e in entries}
+            workspaces: dict[int, HyprlandWorkspace | NiriWorkspace | None] = {
+                ws_id: None for ws_id in PERSISTENT_WORKSPACES if ws_id not in taken
+            }
+            workspaces.update({ws_id: ws for ws_id, ws, _, _ in entries})
+            active_ids = {ws_id for ws_id, _, _, is_active in entries if is_active}
+
+            signature = tuple(
+                (
+                    ws_id,
+                    getattr(ws, "name", None),
+                    _output(ws),
+                    ws_id in active_ids,
+                    _has_windows(ws),
+                )
+                for ws_id, ws in sorted(workspaces.items())
+            )
+            if self._signatures.get(connector) == signature:
+                # Workspace objects may have been recreated; keep buttons
+                # pointing at the current ones without touching the widgets
+                for view in views:
+                    view.rebind(workspaces)
+                continue
+            self._signatures[connector] = signature
 
-    return widget
+            for view in views:
+                view.sync(workspaces, active_ids)
 
 
-def niri_workspace_button(workspace: NiriWorkspace) -> widgets.Button:
-    widget = widgets.Button(
-        css_classes=["workspace"],
-        on_click=lambda x: workspace.switch_to(),
-        child=widgets.Label(label=get_workspace_label(workspace.idx)),
-    )
+def _output(workspace: HyprlandWorkspace | NiriWorkspace | None) -> str | None:
+    if workspace is None:
+        return None
+    if isinstance(workspace, NiriWorkspace):
+        return workspace.output
+    return workspace.monitor
 
-    if workspace.is_active:
-        widget.add_css_class("active")
 
-    return widget
+def _has_windows(workspace: HyprlandWorkspace | NiriWorkspace | None) -> bool:
+    if workspace is None:
+        return False
+    # Niri workspaces do not expose a window count
+    return getattr(workspace, "windows", 1) > 0
 
 
-def workspace_button(workspace) -> widgets.Button:
-    if hyprland.is_available:
-        return hyprland_workspace_button(workspace)
-    elif niri.is_available:
-        return niri_workspace_button(workspace)
-    else:
-        return widgets.Button()
+_router: WorkspaceRouter | None = None
 
 
-def scroll_workspaces(direction: str) -> None:
-    if hyprland.is_available:
-        current = hyprland.active_workspace.id
-        if direction == "up":
-            target = current - 1
-            hyprland.switch_to_workspace(target)
-        else:
-            target = current + 1
-            if target == 11:
-                return
-            hyprland.switch_to_workspace(target)
-    elif niri.is_available:
-        # Get active workspace for Niri
-        active_workspaces = [ws for ws in niri.workspaces if ws.is_active]
-        if not active_workspaces:
-            return
-        
-        current = active_workspaces[0].idx
-        if direction == "up":
-            target = current - 1
-            if target > 0:
-                niri.switch_to_workspace(target)
-        else:
-            target = current + 1
-            if target <= 10:
-                niri.switch_to_workspace(target)
+def get_workspace_router() -> WorkspaceRouter:
+    global _router
+    if _router is None:
+        _router = WorkspaceRouter()
+    return _router
 
 
 class Workspaces(widgets.Box):
     def __init__(self, monitor_name: int):
         self.monitor_name = monitor_name
-
-        if hyprland.is_available:
-            child_content = hyprland.bind_many(
-                ["workspaces", "active_workspace"], transform=self._hyprland_transform
-            )
-        elif niri.is_available:
-            child_content = niri.bind("workspaces", transform=self._niri_transform)
-        else:
-            child_content = []
+        self.connector = get_monitor_connector(monitor_name)
+        self._buttons: dict[int, WorkspaceButton] = {}
 
         super().__init__(
             css_classes=["ws-container"],
             vexpand=False,
             spacing=4,
-            child=child_content,
-        )
-
-    def _hyprland_transform(self, workspaces, active_workspace):
-        buttons = []
-        # Get all workspace IDs (both existing and persistent)
-        all_workspace_ids = set(ws.id for ws in workspaces if ws.id > 0) | set(
-            PERSISTENT_WORKSPACES
         )
-        # Sort all workspace IDs numerically
-        sorted_workspace_ids = sorted(all_workspace_ids)
-
-        for ws_id in sorted_workspace_ids:
-            existing_workspace = next((ws for ws in workspaces if ws.id == ws_id), None)
-            if existing_workspace:
-                buttons.append(workspace_button(existing_workspace))
-            elif ws_id in PERSISTENT_WORKSPACES:
-                is_active = active_workspace and active_workspace.id == ws_id
-                buttons.append(
-                    create_persistent_workspace_button(ws_id, is_active, False)
-                )
 
-        return buttons
-
-    def _niri_transform(self, workspaces):
-        buttons = []
-        # Get the monitor name properly - convert int to string if needed
-        monitor_name = str(self.monitor_name) if isinstance(self.monitor_name, int) else self.monitor_name
-        
-        # For Niri, if no specific monitor filtering is needed, show all workspaces
-        # or filter by the active output if needed
-        active_output = niri.active_output
-        relevant_workspaces = [
-            ws for ws in workspaces 
-            if ws.idx > 0 and (not monitor_name or ws.output == active_output)
-        ]
-        
-        # Get existing workspaces indexed by their idx
-        existing_workspaces = {ws.idx: ws for ws in relevant_workspaces}
-        
-        # Get all workspace IDs (both existing and persistent)
-        all_workspace_ids = set(existing_workspaces.keys()) | set(PERSISTENT_WORKSPACES)
-        # Sort all workspace IDs numerically
-        sorted_workspace_ids = sorted(all_workspace_ids)
-
-        for ws_id in sorted_workspace_ids:
-            existing_workspace = existing_workspaces.get(ws_id)
-            if existing_workspace:
-                buttons.append(workspace_button(existing_workspace))
-            elif ws_id in PERSISTENT_WORKSPACES:
-                buttons.append(create_persistent_workspace_button(ws_id, False, False))
-
-        return buttons
+        self._scroll = ScrollAccumulator(self, self.connector)
+        get_workspace_router().register(self)
+
+    def sync(
+        self,
+        workspaces: dict[int, HyprlandWorkspace | NiriWorkspace | None],
+        active_ids: set[int],
+    ) -> None:
+        """Reconcile buttons with ``workspaces`` and update their states"""
+        self._reconcile(workspaces)
+
+        for ws_id, button in self._buttons.items():
+            if ws_id in active_ids:
+                button.set_state("active")
+            elif _has_windows(button.workspace):
+                button.set_state("occupied")
+            else:
+                button.set_state("empty")
+
+    def rebind(
+        self, workspaces: dict[int, HyprlandWorkspace | NiriWorkspace | None]
+    ) -> None:
+        """Point the buttons at ``workspaces`` when only the objects changed"""
+        for ws_id, button in self._buttons.items():
+            button.workspace = workspaces.get(ws_id)
+
+    def _reconcile(
+        self, workspaces: dict[int, HyprlandWorkspace | NiriWorkspace | None]
+    ) -> None:
+        """Add, remove and reorder buttons so they match ``workspaces`` by ID"""
+        for ws_id in self._buttons.keys() - workspaces.keys():
+            self.remove(self._buttons.pop(ws_id))
+
+        previous = None
+        for ws_id in sorted(workspaces):
+            button = self._buttons.get(ws_id)
+            if button is None:
+                button = WorkspaceButton(ws_id)
+                self._buttons[ws_id] = button
+                self.insert_child_after(button, previous)
+            elif button.get_prev_sibling() is not previous:
+                self.reorder_child_after(button, previous)
+
+            button.workspace = workspaces[ws_id]
+            previous = button
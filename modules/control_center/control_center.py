@@ -1,6 +1,8 @@
 from ignis import widgets
 from ignis.window_manager import WindowManager
 
+from services.startup_report import measure_deferred
+
 from .menu import opened_menu
 from .widgets import (
     Brightness,
@@ -33,26 +35,13 @@ class ControlCenter(widgets.RevealerWindow):
         # Always use monitor 0 for single instance, but store requested monitor  
         self.requested_monitor = monitor_id
         
+        # Filled on first open, see __build_content
+        self._content = widgets.Box(vertical=True, css_classes=["control-center"])
+        self._built = False
+
         revealer = widgets.Revealer(
             transition_type="slide_left",
-            child=widgets.Box(
-                vertical=True,
-                css_classes=["control-center"],
-                child=[
-                    widgets.Box(
-                        vertical=True,
-                        css_classes=["control-center-widget"],
-                        child=[
-                            User(),
-                            QuickSettings(),
-                            VolumeSlider("speaker"),
-                            VolumeSlider("microphone"),
-                            Brightness(),
-                        ],
-                    ),
-                    NotificationCenter(),
-                ],
-            ),
+            child=self._content,
             transition_duration=300,
             reveal_child=True,
         )
@@ -82,3 +71,27 @@ class ControlCenter(widgets.RevealerWindow):
             ),
             revealer=revealer,
         )
+
+        self.connect("notify::visible", lambda *_: self.__build_content())
+
+    def __build_content(self) -> None:
+        """Build the widgets and their service bindings the first time the window opens"""
+        if self._built or not self.visible:
+            return
+        self._built = True
+
+        with measure_deferred("Control center"):
+            self._content.child = [
+                widgets.Box(
+                    vertical=True,
+                    css_classes=["control-center-widget"],
+                    child=[
+                        User(),
+                        QuickSettings(),
+                        VolumeSlider("speaker"),
+                        VolumeSlider("microphone"),
+                        Brightness(),
+                    ],
+                ),
+                NotificationCenter(),
+            ]
@@ -1,18 +1,35 @@
+from typing import Callable
+
 from gi.repository import GObject  # type: ignore
 from ignis import widgets
 from ignis.variable import Variable
 from ignis.base_widget import BaseWidget
 
+from services.startup_report import measure_deferred
+
 opened_menu = Variable()
 
 
 class Menu(widgets.Revealer):
-    def __init__(self, name: str, child: list[BaseWidget], **kwargs):
+    """
+    A collapsible quick settings menu.
+
+    ``child`` may be a callable returning the children; it is then called
+    the first time the menu is revealed, so closed menus cost nothing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        child: list[BaseWidget] | Callable[[], list[BaseWidget]],
+        **kwargs,
+    ):
         self._name = name
+        self._build_child = child if callable(child) else None
         self._box = widgets.Box(
             vertical=True,
             css_classes=["control-center-menu"],
-            child=child,
+            child=[] if callable(child) else child,
         )
 
         super().__init__(
@@ -23,6 +40,16 @@ class Menu(widgets.Revealer):
             **kwargs,
         )
 
+        if self._build_child:
+            self.connect("notify::reveal-child", lambda *_: self.__build())
+
+    def __build(self) -> None:
+        if not self.reveal_child or self._build_child is None:
+            return
+        build_child, self._build_child = self._build_child, None
+        with measure_deferred(f"{self._name} menu"):
+            self._box.child = build_child()
+
     def toggle(self) -> None:
         if self.reveal_child:
             opened_menu.value = ""
@@ -1,13 +1,24 @@
-import asyncio
-
 from ignis import widgets
 from ignis.services.backlight import BacklightService
 
+from services.coalesced_setter import get_brightness_setter
+
 backlight = BacklightService.get_default()
+brightness_setter = get_brightness_setter()
 
 
 class Brightness(widgets.Box):
     def __init__(self):
+        scale = widgets.Scale(
+            min=0,
+            max=backlight.max_brightness,
+            hexpand=True,
+            value=backlight.brightness,
+            css_classes=["material-slider"],
+            on_change=lambda x: self.__on_change(x.value),
+        )
+        self._scale = scale
+
         super().__init__(
             visible=backlight.bind("available"),
             hexpand=True,
@@ -18,15 +29,17 @@ class Brightness(widgets.Box):
                     css_classes=["material-slider-icon"],
                     pixel_size=18,
                 ),
-                widgets.Scale(
-                    min=0,
-                    max=backlight.max_brightness,
-                    hexpand=True,
-                    value=backlight.bind("brightness"),
-                    css_classes=["material-slider"],
-                    on_change=lambda x: asyncio.create_task(
-                        backlight.set_brightness_async(x.value)
-                    ),
-                ),
+                scale,
             ],
         )
+
+        backlight.connect("notify::brightness", lambda *_: self.__sync())
+
+    def __sync(self) -> None:
+        # Ignore the echoes of our own writes while the slider is dragged
+        if not brightness_setter.is_echo(backlight.brightness):
+            self._scale.value = backlight.brightness
+
+    def __on_change(self, value: float) -> None:
+        if value != backlight.brightness:
+            brightness_setter.set(value)
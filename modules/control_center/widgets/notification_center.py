@@ -1,78 +1,294 @@
-from gi.repository import GLib  # type: ignore
+import os
+import time
+
+from gi.repository import Gio, GLib, GObject, Gtk  # type: ignore
 from ignis import utils, widgets
 from ignis.services.notifications import Notification, NotificationService
 
+from services.notification_history import (
+    PAGE_SIZE as HISTORY_PAGE_SIZE,
+    HistoryEntry,
+    NotificationHistoryService,
+)
+
 from ...shared_widgets import NotificationWidget
 
 notifications = NotificationService.get_default()
+history = NotificationHistoryService.get_default()
 
+# Typing pause before the history is queried
+SEARCH_DELAY = 200  # ms
 
-class Popup(widgets.Revealer):
-    def __init__(self, notification: Notification, **kwargs):
-        widget = NotificationWidget(notification)
-        super().__init__(child=widget, transition_type="slide_down", **kwargs)
-
-        notification.connect("closed", lambda x: self.destroy())
 
-    def destroy(self):
-        self.reveal_child = False
-        utils.Timeout(self.transition_duration, self.unparent)
+class NotificationList(widgets.Box):
+    """
+    Notification history backed by a ``Gio.ListStore`` and a ``Gtk.ListView``.
 
+    Each row owns one ``NotificationWidget``, created once in ``setup``; the
+    list view recycles rows as it scrolls and ``bind`` only updates their
+    labels, icon and actions.
+    """
 
-class NotificationList(widgets.Box):
     __gtype_name__ = "NotificationList"
 
     def __init__(self):
-        loading_notifications_label = widgets.Label(
-            label="Loading notifications...",
+        self._store = Gio.ListStore(item_type=Notification)
+        self._closed: set[Notification] = set()
+        self._flush_id = 0
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.__on_setup)
+        factory.connect("bind", self.__on_bind)
+        factory.connect("unbind", self.__on_unbind)
+
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=self._store),
+            factory=factory,
+            css_classes=["notification-list"],
+        )
+
+        super().__init__(
+            vertical=True,
+            vexpand=True,
+            child=[
+                widgets.Scroll(child=list_view, vexpand=True),
+                widgets.Label(
+                    label="No notifications",
+                    valign="center",
+                    vexpand=True,
+                    visible=notifications.bind(
+                        "notifications", lambda value: len(value) == 0
+                    ),
+                    css_classes=["notification-center-info-label"],
+                ),
+            ],
+        )
+
+        items = list(reversed(notifications.notifications))
+        for notification in items:
+            self.__track(notification)
+        self._store.splice(0, 0, items)
+
+        notifications.connect(
+            "notified", lambda x, notification: self.__on_notified(notification)
+        )
+
+    def __on_setup(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.set_activatable(False)
+        list_item.set_child(NotificationWidget())
+
+    def __on_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().bind(list_item.get_item())
+
+    def __on_unbind(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().unbind()
+
+    def __track(self, notification: Notification) -> None:
+        notification.connect("closed", self.__on_closed)
+
+    def __on_notified(self, notification: Notification) -> None:
+        self.__track(notification)
+        self._store.insert(0, notification)
+
+    def __on_closed(self, notification: Notification) -> None:
+        # "Clear all" closes every notification in a row; remove them in one
+        # model update instead of one O(n) removal each
+        self._closed.add(notification)
+        if not self._flush_id:
+            self._flush_id = GLib.idle_add(self.__flush_closed)
+
+    def __flush_closed(self) -> bool:
+        self._flush_id = 0
+        closed, self._closed = self._closed, set()
+
+        if len(notifications.notifications) == 0:
+            self._store.remove_all()
+            return GLib.SOURCE_REMOVE
+
+        if len(closed) == 1:
+            found, position = self._store.find(closed.pop())
+            if found:
+                self._store.remove(position)
+            return GLib.SOURCE_REMOVE
+
+        remaining = [item for item in self._store if item not in closed]
+        self._store.splice(0, self._store.get_n_items(), remaining)
+        return GLib.SOURCE_REMOVE
+
+
+class HistoryItem(GObject.Object):
+    """List model item wrapping a ``HistoryEntry``"""
+
+    def __init__(self, entry: HistoryEntry):
+        super().__init__()
+        self.entry = entry
+
+
+class HistoryRow(widgets.Box):
+    """Compact, read-only row for a notification history entry"""
+
+    def __init__(self):
+        self._icon = widgets.Icon(pixel_size=24, valign="start")
+        self._summary = widgets.Label(
+            ellipsize="end",
+            halign="start",
+            css_classes=["notification-summary"],
+        )
+        self._body = widgets.Label(
+            ellipsize="end",
+            halign="start",
+            css_classes=["notification-body"],
+        )
+        self._time = widgets.Label(
+            valign="start",
+            css_classes=["notification-history-time"],
+        )
+
+        super().__init__(
+            css_classes=["notification", "notification-history-row"],
+            spacing=12,
+            child=[
+                self._icon,
+                widgets.Box(
+                    vertical=True,
+                    hexpand=True,
+                    child=[self._summary, self._body],
+                ),
+                self._time,
+            ],
+        )
+
+    def bind(self, entry: HistoryEntry) -> None:
+        icon = entry.app_icon
+        if not icon or os.path.isabs(icon.removeprefix("file://")):
+            icon = "dialog-information-symbolic"
+
+        self._icon.image = icon
+        self._summary.label = entry.summary
+        self._summary.visible = entry.summary != ""
+        self._body.label = entry.body
+        self._body.visible = entry.body != ""
+        self._time.label = time.strftime("%d %b %H:%M", time.localtime(entry.time))
+
+
+class HistoryResults(widgets.Box):
+    """
+    Search results from the persistent notification history.
+
+    Results are fetched one page at a time into a ``Gio.ListStore`` shown by
+    a ``Gtk.ListView``; the next page is requested when the list is scrolled
+    to the bottom.
+    """
+
+    def __init__(self):
+        self._query = ""
+        self._generation = 0
+        self._loaded = 0
+        self._loading = False
+        self._exhausted = False
+        self._search_timeout: utils.Timeout | None = None
+
+        self._store = Gio.ListStore(item_type=HistoryItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.__on_setup)
+        factory.connect("bind", self.__on_bind)
+
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=self._store),
+            factory=factory,
+            css_classes=["notification-list"],
+        )
+
+        self._empty_label = widgets.Label(
+            label="No matching notifications",
             valign="center",
             vexpand=True,
+            visible=False,
             css_classes=["notification-center-info-label"],
         )
+        scroll = widgets.Scroll(child=list_view, vexpand=True)
+        scroll.connect("edge-reached", self.__on_edge_reached)
 
         super().__init__(
             vertical=True,
-            child=[loading_notifications_label],
             vexpand=True,
-            setup=lambda self: notifications.connect(
-                "notified",
-                lambda x, notification: self.__on_notified(notification),
-            ),
+            child=[scroll, self._empty_label],
         )
 
-        utils.ThreadTask(
-            self.__load_notifications,
-            lambda result: self.set_child(result),
-        ).run()
+    def __on_setup(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.set_activatable(False)
+        list_item.set_child(HistoryRow())
 
-    def __on_notified(self, notification: Notification) -> None:
-        notify = Popup(notification)
-        self.prepend(notify)
-        notify.reveal_child = True
-
-    def __load_notifications(self) -> list[widgets.Label | Popup]:
-        contents: list[widgets.Label | Popup] = []
-        for i in reversed(notifications.notifications):
-            GLib.idle_add(lambda i=i: contents.append(Popup(i, reveal_child=True)))
-
-        contents.append(
-            widgets.Label(
-                label="No notifications",
-                valign="center",
-                vexpand=True,
-                visible=notifications.bind(
-                    "notifications", lambda value: len(value) == 0
-                ),
-                css_classes=["notification-center-info-label"],
-            )
+    def __on_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().bind(list_item.get_item().entry)
+
+    def search(self, query: str) -> None:
+        """Replace the results with entries matching ``query``, debounced"""
+        self._query = query.strip()
+        if self._search_timeout:
+            self._search_timeout.cancel()
+        self._search_timeout = utils.Timeout(SEARCH_DELAY, self.__start_search)
+
+    def __start_search(self) -> None:
+        self._search_timeout = None
+        self._generation += 1
+        self._loaded = 0
+        self._loading = False
+        self._exhausted = False
+        self._store.remove_all()
+        self.__load_page()
+
+    def __load_page(self) -> None:
+        if self._loading or self._exhausted or not self._query:
+            return
+        self._loading = True
+
+        generation = self._generation
+        history.search(
+            self._query,
+            lambda entries: self.__on_page(generation, entries),
+            offset=self._loaded,
         )
-        return contents
+
+    def __on_page(self, generation: int, entries: list[HistoryEntry]) -> None:
+        if generation != self._generation:
+            # A newer search replaced this one
+            return
+        self._loading = False
+        self._exhausted = len(entries) < HISTORY_PAGE_SIZE
+        self._loaded += len(entries)
+
+        self._store.splice(
+            self._store.get_n_items(), 0, [HistoryItem(entry) for entry in entries]
+        )
+        self._empty_label.visible = self._loaded == 0
+
+    def __on_edge_reached(self, scroll, position: Gtk.PositionType) -> None:
+        if position == Gtk.PositionType.BOTTOM:
+            self.__load_page()
 
 
 class NotificationCenter(widgets.Box):
     __gtype_name__ = "NotificationCenter"
 
     def __init__(self):
+        notification_list = NotificationList()
+        history_results = HistoryResults()
+        history_results.visible = False
+
+        def on_search(entry) -> None:
+            searching = entry.text.strip() != ""
+            notification_list.visible = not searching
+            history_results.visible = searching
+            history_results.search(entry.text)
+
+        search_entry = widgets.Entry(
+            placeholder_text="Search notification history",
+            on_change=on_search,
+            css_classes=["notification-search"],
+        )
+
         super().__init__(
             vertical=True,
             vexpand=True,
@@ -100,9 +316,8 @@ class NotificationCenter(widgets.Box):
                         ),
                     ],
                 ),
-                widgets.Scroll(
-                    child=NotificationList(),
-                    vexpand=True,
-                ),
+                search_entry,
+                notification_list,
+                history_results,
             ],
         )
@@ -9,6 +9,9 @@ from ...qs_button import QSButton
 
 bluetooth = BluetoothService.get_default()
 
+# Discovery is stopped after this long even if the menu stays open
+SETUP_MODE_TIMEOUT = 60_000  # ms
+
 
 class BluetoothDeviceItem(widgets.Button):
     def __init__(self, device: BluetoothDevice):
@@ -78,26 +81,64 @@ class BluetoothDeviceItem(widgets.Button):
         )
 
 
+class BluetoothDeviceList(widgets.Box):
+    """Device rows keyed by address; rows update themselves through bindings"""
+
+    def __init__(self):
+        self._items: dict[str, BluetoothDeviceItem] = {}
+        self._empty_label = widgets.Label(
+            halign="center",
+            css_classes=["dim-label"],
+        )
+
+        super().__init__(vertical=True, child=[self._empty_label])
+
+        bluetooth.connect("notify::devices", lambda *_: self.__sync())
+        bluetooth.connect("notify::state", lambda *_: self.__update_empty_label())
+        self.__sync()
+
+    def __update_empty_label(self) -> None:
+        self._empty_label.visible = not self._items
+        self._empty_label.label = (
+            "No devices found"
+            if bluetooth.state != "absent"
+            else "Service integration issue"
+        )
+
+    def __sync(self) -> None:
+        devices = {device.address: device for device in bluetooth.devices}
+
+        for address in self._items.keys() - devices.keys():
+            self.remove(self._items.pop(address))
+
+        previous = self._empty_label
+        for address, device in devices.items():
+            item = self._items.get(address)
+            if item is None:
+                item = BluetoothDeviceItem(device)
+                self._items[address] = item
+                self.insert_child_after(item, previous)
+            elif item.get_prev_sibling() is not previous:
+                self.reorder_child_after(item, previous)
+            previous = item
+
+        self.__update_empty_label()
+
+
 class BluetoothMenu(Menu):
     def __init__(self):
-        self._setup_mode_enabled = False
+        self._setup_mode_timeout: utils.Timeout | None = None
 
         super().__init__(
             name="bluetooth",
-            child=[
+            child=lambda: [
                 ToggleBox(
                     label="Bluetooth",
                     active=bluetooth.bind("powered"),
                     on_change=lambda x, state: bluetooth.set_powered(state),
                     css_classes=["network-header-box"],
                 ),
-                widgets.Box(
-                    vertical=True,
-                    child=bluetooth.bind(
-                        "devices",
-                        transform=self._transform_devices,
-                    ),
-                ),
+                BluetoothDeviceList(),
                 widgets.Separator(),
                 widgets.Button(
                     css_classes=["network-item", "unset"],
@@ -118,33 +159,36 @@ class BluetoothMenu(Menu):
             ],
         )
 
-        # Connect to reveal state changes to enable setup mode only when expanded
+        # Discovery only runs while the menu is expanded
         self.connect("notify::reveal-child", self._on_reveal_changed)
 
     def _on_reveal_changed(self, *args):
         """Called when the menu is expanded or collapsed"""
         if self.reveal_child:
-            self.enable_setup_mode_if_needed()
-
-    def _transform_devices(self, devices):
-        """Transform device list into widgets, with caching to reduce recreation"""
-        if not devices:
-            return [
-                widgets.Label(
-                    label="No devices found"
-                    if bluetooth.state != "absent"
-                    else "Service integration issue",
-                    halign="center",
-                    css_classes=["dim-label"],
-                )
-            ]
-        return [BluetoothDeviceItem(device) for device in devices]
-
-    def enable_setup_mode_if_needed(self):
-        """Enable setup mode only when the menu is actually opened and needs fresh device scan"""
-        if not self._setup_mode_enabled:
+            self.start_setup_mode()
+        else:
+            self.stop_setup_mode()
+
+    def start_setup_mode(self) -> None:
+        """Start discovery, stopping automatically after SETUP_MODE_TIMEOUT"""
+        if self._setup_mode_timeout:
+            self._setup_mode_timeout.cancel()
+        if not bluetooth.setup_mode:
             bluetooth.set_setup_mode(True)
-            self._setup_mode_enabled = True
+        self._setup_mode_timeout = utils.Timeout(
+            SETUP_MODE_TIMEOUT, self.__on_setup_mode_timeout
+        )
+
+    def __on_setup_mode_timeout(self) -> None:
+        self._setup_mode_timeout = None
+        self.stop_setup_mode()
+
+    def stop_setup_mode(self) -> None:
+        if self._setup_mode_timeout:
+            self._setup_mode_timeout.cancel()
+            self._setup_mode_timeout = None
+        if bluetooth.setup_mode:
+            bluetooth.set_setup_mode(False)
 
 
 class BluetoothButton(QSButton):
@@ -44,7 +44,7 @@ class EthernetMenu(Menu):
     def __init__(self):
         super().__init__(
             name="ethernet",
-            child=[
+            child=lambda: [
                 widgets.Box(
                     css_classes=["network-header-box"],
                     child=[
@@ -38,6 +38,8 @@ class IdleInhibitorButton(QSButton):
             icon_name=idle_inhibitor.bind("is_inhibiting", get_icon),
             on_activate=toggle_inhibitor,
             on_deactivate=toggle_inhibitor,
-            active=idle_inhibitor.bind("is_inhibiting"),
+            # Reflects the manual toggle; automatic inhibition only shows in
+            # the label and icon
+            active=idle_inhibitor.bind("manual"),
             visible=idle_inhibitor.bind("available"),
         )
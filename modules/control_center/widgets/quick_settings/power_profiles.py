@@ -49,7 +49,7 @@ class PowerProfilesMenu(Menu):
     def __init__(self):
         super().__init__(
             name="power_profiles",
-            child=[
+            child=lambda: [
                 widgets.Label(
                     label="Power Profile",
                     css_classes=["network-header-box"],
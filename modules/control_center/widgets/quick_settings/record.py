@@ -75,7 +75,7 @@ class RecordMenu(Menu):
 
         super().__init__(
             name="recording",
-            child=[
+            child=lambda: [
                 widgets.Icon(
                     image="media-record-symbolic",
                     pixel_size=36,
@@ -249,7 +249,7 @@ class RecordControlMenu(Menu):
     def __init__(self):
         super().__init__(
             name="recording-controls",
-            child=[
+            child=lambda: [
                 widgets.Icon(
                     image="media-playback-pause-symbolic",
                     pixel_size=36,
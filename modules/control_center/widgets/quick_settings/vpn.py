@@ -42,7 +42,7 @@ class VpnMenu(Menu):
     def __init__(self):
         super().__init__(
             name="vpn",
-            child=[
+            child=lambda: [
                 widgets.Box(
                     css_classes=["network-header-box"],
                     child=[
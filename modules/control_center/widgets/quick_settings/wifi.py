@@ -9,51 +9,162 @@ from ignis.services.network import NetworkService, WifiAccessPoint, WifiDevice
 network = NetworkService.get_default()
 
 
+# Access point scans are applied at most this often while the menu is open
+REFRESH_INTERVAL = 1000  # ms
+
+
 class WifiNetworkItem(widgets.Button):
-    def __init__(self, access_point: WifiAccessPoint):
+    """
+    Row for one SSID. The row is kept while the SSID is visible and only
+    switches to the strongest access point broadcasting it.
+    """
+
+    def __init__(self, ssid: str):
+        self.ssid = ssid
+        self.access_point: WifiAccessPoint | None = None
+
+        self._icon = widgets.Icon()
+        self._connected_icon = widgets.Icon(
+            image="object-select-symbolic",
+            halign="end",
+            hexpand=True,
+            visible=False,
+        )
+
         super().__init__(
             css_classes=["network-item", "unset"],
-            on_click=lambda x: asyncio.create_task(access_point.connect_to_graphical()),
+            on_click=lambda x: self.__on_click(),
             child=widgets.Box(
                 child=[
-                    widgets.Icon(
-                        image=access_point.bind(
-                            "strength", transform=lambda value: access_point.icon_name
-                        ),
-                    ),
+                    self._icon,
                     widgets.Label(
-                        label=access_point.ssid,
+                        label=ssid,
                         halign="start",
                     ),
-                    widgets.Icon(
-                        image="object-select-symbolic",
-                        halign="end",
-                        hexpand=True,
-                        visible=access_point.bind("is_connected"),
-                    ),
+                    self._connected_icon,
                 ]
             ),
         )
 
+    def __on_click(self) -> None:
+        if self.access_point is not None:
+            asyncio.create_task(self.access_point.connect_to_graphical())
+
+    def update(self, access_point: WifiAccessPoint) -> None:
+        self.access_point = access_point
+        if self._icon.image != access_point.icon_name:
+            self._icon.image = access_point.icon_name
+        self._connected_icon.visible = access_point.is_connected
+
+
+class WifiNetworkList(widgets.Box):
+    """
+    Access points of a device, one row per SSID, strongest first.
+
+    Updates are throttled to ``REFRESH_INTERVAL`` and deferred entirely
+    while the followed menu is collapsed.
+    """
+
+    def __init__(self, device: WifiDevice):
+        self._device = device
+        self._menu: Menu | None = None
+        self._items: dict[str, WifiNetworkItem] = {}
+        self._watched: dict[WifiAccessPoint, list[int]] = {}
+        self._dirty = True
+        self._refresh_timeout: utils.Timeout | None = None
+
+        super().__init__(vertical=True)
+
+        device.connect("notify::access-points", lambda *_: self.queue_refresh())
+
+    def follow(self, menu: Menu) -> None:
+        """Only process updates while ``menu`` is revealed"""
+        self._menu = menu
+        menu.connect("notify::reveal-child", lambda *_: self.__on_reveal_changed())
+        self.__on_reveal_changed()
+
+    def __is_visible(self) -> bool:
+        return self._menu is None or self._menu.reveal_child
+
+    def __on_reveal_changed(self) -> None:
+        if self.__is_visible() and self._dirty:
+            self.refresh()
+
+    def queue_refresh(self) -> None:
+        self._dirty = True
+        if not self.__is_visible() or self._refresh_timeout:
+            return
+        self._refresh_timeout = utils.Timeout(REFRESH_INTERVAL, self.__on_refresh_timeout)
+
+    def __on_refresh_timeout(self) -> None:
+        self._refresh_timeout = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        if self._refresh_timeout:
+            self._refresh_timeout.cancel()
+            self._refresh_timeout = None
+        self._dirty = False
+
+        strongest: dict[str, WifiAccessPoint] = {}
+        for ap in self._device.access_points:
+            if not ap.ssid:
+                continue
+            current = strongest.get(ap.ssid)
+            if (
+                current is None
+                or (ap.is_connected, ap.strength) > (current.is_connected, current.strength)
+            ):
+                strongest[ap.ssid] = ap
+
+        access_points = sorted(
+            strongest.values(), key=lambda ap: (not ap.is_connected, -ap.strength)
+        )
+        self.__watch(access_points)
+
+        for ssid in self._items.keys() - strongest.keys():
+            self.remove(self._items.pop(ssid))
+
+        previous = None
+        for ap in access_points:
+            item = self._items.get(ap.ssid)
+            if item is None:
+                item = WifiNetworkItem(ap.ssid)
+                self._items[ap.ssid] = item
+                self.insert_child_after(item, previous)
+            elif item.get_prev_sibling() is not previous:
+                self.reorder_child_after(item, previous)
+
+            item.update(ap)
+            previous = item
+
+    def __watch(self, access_points: list[WifiAccessPoint]) -> None:
+        """Follow strength and connection changes of the displayed access points"""
+        for ap in self._watched.keys() - set(access_points):
+            for handler_id in self._watched.pop(ap):
+                ap.disconnect(handler_id)
+
+        for ap in access_points:
+            if ap not in self._watched:
+                self._watched[ap] = [
+                    ap.connect("notify::strength", lambda *_: self.queue_refresh()),
+                    ap.connect("notify::is-connected", lambda *_: self.queue_refresh()),
+                ]
+
 
 class WifiMenu(Menu):
     def __init__(self, device: WifiDevice):
-        super().__init__(
-            name="wifi",
-            child=[
+        def build() -> list:
+            network_list = WifiNetworkList(device)
+            network_list.follow(self)
+            return [
                 ToggleBox(
                     label="Wi-Fi",
                     active=network.wifi.enabled,
                     on_change=lambda x, state: network.wifi.set_enabled(state),
                     css_classes=["network-header-box"],
                 ),
-                widgets.Box(
-                    vertical=True,
-                    child=device.bind(
-                        "access_points",
-                        transform=lambda value: [WifiNetworkItem(i) for i in value],
-                    ),
-                ),
+                network_list,
                 widgets.Separator(),
                 widgets.Button(
                     css_classes=["network-item", "unset"],
@@ -69,8 +180,9 @@ class WifiMenu(Menu):
                         ]
                     ),
                 ),
-            ],
-        )
+            ]
+
+        super().__init__(name="wifi", child=build)
 
 
 class WifiButton(QSButton):
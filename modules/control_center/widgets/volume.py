@@ -4,6 +4,8 @@ from typing import Literal
 from ignis import utils, widgets
 from ignis.services.audio import AudioService, Stream
 
+from services.coalesced_setter import get_volume_setter
+
 from ...shared_widgets import MaterialVolumeSlider
 from ..menu import Menu
 
@@ -52,7 +54,7 @@ class DeviceMenu(Menu):
 
         super().__init__(
             name=f"volume-{_type}",
-            child=[
+            child=lambda: [
                 widgets.Box(
                     child=[
                         widgets.Icon(image=data["menu_icon"], pixel_size=24),
@@ -66,6 +68,11 @@ class DeviceMenu(Menu):
                 ),
                 widgets.Box(
                     vertical=True,
+                    # Built on first reveal: list the existing devices, then follow new ones
+                    child=[
+                        DeviceItem(stream, _type)
+                        for stream in getattr(audio, f"{_type}s")
+                    ],
                     setup=lambda self: audio.connect(
                         f"{_type}-added",
                         lambda x, stream: self.append(DeviceItem(stream, _type)),
@@ -112,7 +119,7 @@ class VolumeSlider(widgets.Box):
 
         scale = MaterialVolumeSlider(
             stream=stream,
-            on_change=lambda x: stream.set_volume(x.value),
+            setter=get_volume_setter(_type),
             sensitive=stream.bind("is_muted", lambda value: not value),
         )
 
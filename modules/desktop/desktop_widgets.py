@@ -1,22 +1,16 @@
-from ignis import widgets, utils
-import datetime
-from ignis.variable import Variable
+from ignis import widgets
+from services.clock import ClockService
 from ..shared_widgets.fixed import Fixed, FixedChild
 from user_options import user_options
 
+clock = ClockService.get_default()
+
 
 class TimeWidget(widgets.Window):
     def __init__(self, monitor_id: int = 0):
         self.time_label = widgets.Label(css_classes=["movable-time"], use_markup=True)
 
-        time_variable = Variable(
-            value=utils.Poll(
-                1000,
-                lambda x: datetime.datetime.now().strftime("%I:%M"),
-            ).bind("output")
-        )
-
-        self.time_label.label = time_variable.bind("value")
+        self.time_label.label = clock.format("%I:%M").bind("value")
 
         self.fixed_container = Fixed(
             hexpand=True,
@@ -78,14 +72,7 @@ class DateWidget(widgets.Window):
     def __init__(self, monitor_id: int = 0):
         self.date_label = widgets.Label(css_classes=["movable-date"], use_markup=True)
 
-        date_variable = Variable(
-            value=utils.Poll(
-                1000,
-                lambda x: datetime.datetime.now().strftime("%A %-d, %b"),
-            ).bind("output")
-        )
-
-        self.date_label.label = date_variable.bind("value")
+        self.date_label.label = clock.format("%A %-d, %b").bind("value")
 
         self.fixed_container = Fixed(
             hexpand=True,
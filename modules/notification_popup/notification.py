@@ -1,37 +1,161 @@
+import time
+from collections import deque
+
 from ignis import utils, widgets
 from ignis.services.notifications import Notification, NotificationService
 
+from services.monitors import get_focused_monitor_id
+from user_options import user_options
+
 from ..shared_widgets import NotificationWidget
 
 notifications = NotificationService.get_default()
 
+# An app may open this many new popups per window; further notifications are
+# merged into its existing popup (or only kept in the notification center)
+APP_RATE_LIMIT = 3
+APP_RATE_WINDOW = 10  # s
+
+# Popups beyond this are removed, oldest first, without animation
+MAX_VISIBLE_POPUPS = 4
+
+# Older notifications listed when a group is expanded
+GROUP_PREVIEW_LIMIT = 5
+
+
+class PopupGroup(widgets.Box):
+    """
+    A popup for consecutive notifications from one app.
 
-class Popup(widgets.Box):
-    def __init__(
-        self, box: "PopupBox", window: "NotificationPopup", notification: Notification
-    ):
+    Only the newest notification is shown in the group's single
+    ``NotificationWidget``, which is rebound in place as notifications merge;
+    older ones are listed as one-line summaries when the counter is clicked.
+    """
+
+    def __init__(self, box: "PopupBox", notification: Notification):
         self._box = box
-        self._window = window
+        self.app_name = notification.app_name
+        self._notifications: list[Notification] = []
+        # notification -> "dismissed" handler id
+        self._handlers: dict[Notification, int] = {}
+        self._shown: Notification | None = None
+        self._closing = False
+
+        self._widget = NotificationWidget()
+        self._widget.css_classes = ["notification-popup"]
+        self._current = widgets.Box(child=[self._widget])
+        self._counter = widgets.Button(
+            child=widgets.Label(),
+            halign="start",
+            valign="start",
+            visible=False,
+            css_classes=["notification-group-count"],
+            on_click=lambda x: self.toggle_expanded(),
+        )
+        self._older = widgets.Box(vertical=True, css_classes=["notification-group-list"])
+        self._older_revealer = widgets.Revealer(
+            transition_type="slide_down", child=self._older
+        )
 
-        widget = NotificationWidget(notification)
-        widget.css_classes = ["notification-popup"]
         self._inner = widgets.Revealer(
-            transition_type="slide_left", child=widgets.Box(child=[widget])
+            transition_type="slide_left",
+            child=widgets.Box(
+                vertical=True,
+                child=[
+                    widgets.Overlay(child=self._current, overlays=[self._counter]),
+                    self._older_revealer,
+                ],
+            ),
         )
         self._outer = widgets.Revealer(transition_type="slide_down", child=self._inner)
         super().__init__(child=[self._outer], halign="end")
 
-        notification.connect("dismissed", lambda x: self.destroy())
+        self.add(notification)
+
+    def add(self, notification: Notification) -> None:
+        self._notifications.append(notification)
+        self._handlers[notification] = notification.connect(
+            "dismissed", self.__on_dismissed
+        )
+        self.__show(notification)
+        self.__update_counter()
+
+    def reveal(self) -> None:
+        self._outer.reveal_child = True
+        utils.Timeout(
+            self._outer.transition_duration, self._inner.set_reveal_child, True
+        )
+
+    def toggle_expanded(self) -> None:
+        expand = not self._older_revealer.reveal_child
+        if expand:
+            self.__fill_older()
+        self._older_revealer.reveal_child = expand
+
+    def __show(self, notification: Notification) -> None:
+        self._widget.bind(notification)
+        self._shown = notification
+
+    def __update_counter(self) -> None:
+        count = len(self._notifications)
+        self._counter.visible = count > 1
+        self._counter.child.label = str(count)
+        if self._older_revealer.reveal_child:
+            self.__fill_older()
+
+    def __fill_older(self) -> None:
+        older = self._notifications[-2::-1]
+        rows = [
+            widgets.Label(
+                label=notification.summary or notification.body,
+                ellipsize="end",
+                halign="start",
+                css_classes=["notification-group-item"],
+            )
+            for notification in older[:GROUP_PREVIEW_LIMIT]
+        ]
+        if len(older) > GROUP_PREVIEW_LIMIT:
+            rows.append(
+                widgets.Label(
+                    label=f"+{len(older) - GROUP_PREVIEW_LIMIT} more",
+                    halign="start",
+                    css_classes=["notification-group-item"],
+                )
+            )
+        self._older.child = rows
 
-    def destroy(self):
-        def box_destroy():
+    def __on_dismissed(self, notification: Notification) -> None:
+        if self._closing or notification not in self._notifications:
+            return
+
+        self._notifications.remove(notification)
+        notification.disconnect(self._handlers.pop(notification))
+        if not self._notifications:
+            self.destroy()
+            return
+
+        if notification is self._shown:
+            self.__show(self._notifications[-1])
+        self.__update_counter()
+
+    def destroy(self, animate: bool = True) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self._box.forget(self)
+
+        for notification, handler_id in self._handlers.items():
+            notification.disconnect(handler_id)
+        self._handlers.clear()
+        self._widget.unbind()
+
+        if not animate:
             self.unparent()
-            if len(notifications.popups) == 0:
-                self._window.visible = False
+            return
 
         def outer_close():
             self._outer.reveal_child = False
-            utils.Timeout(self._outer.transition_duration, box_destroy)
+            utils.Timeout(self._outer.transition_duration, self.unparent)
 
         self._inner.transition_type = "slide_right"
         self._inner.reveal_child = False
@@ -39,9 +163,20 @@ class Popup(widgets.Box):
 
 
 class PopupBox(widgets.Box):
-    def __init__(self, window: "NotificationPopup", monitor: int):
+    """
+    Popup stack with burst control.
+
+    Consecutive notifications from one app are merged into one group, apps
+    exceeding ``APP_RATE_LIMIT`` only update their existing group, and at
+    most ``MAX_VISIBLE_POPUPS`` groups are shown at once.
+    """
+
+    def __init__(self, window: "NotificationPopup"):
         self._window = window
-        self._monitor = monitor
+        # Newest first, matching the on-screen order
+        self._groups: list[PopupGroup] = []
+        self._groups_by_app: dict[str, PopupGroup] = {}
+        self._recent: dict[str, deque[float]] = {}
 
         super().__init__(
             vertical=True,
@@ -52,26 +187,88 @@ class PopupBox(widgets.Box):
             ),
         )
 
+    def forget(self, group: PopupGroup) -> None:
+        """Stop tracking a group that is being closed"""
+        if group in self._groups:
+            self._groups.remove(group)
+        if self._groups_by_app.get(group.app_name) is group:
+            del self._groups_by_app[group.app_name]
+
+        if not self._groups:
+            utils.Timeout(
+                group._outer.transition_duration * 2, self.__hide_if_empty
+            )
+
+    def __hide_if_empty(self) -> None:
+        if not self._groups:
+            self._window.visible = False
+
+    def __within_rate(self, app_name: str) -> bool:
+        now = time.monotonic()
+        recent = self._recent.setdefault(app_name, deque())
+        while recent and recent[0] < now - APP_RATE_WINDOW:
+            recent.popleft()
+
+        if len(recent) >= APP_RATE_LIMIT:
+            return False
+        recent.append(now)
+        return True
+
     def __on_notified(self, notification: Notification) -> None:
-        self._window.visible = True
-        popup = Popup(box=self, window=self._window, notification=notification)
-        self.prepend(popup)
-        popup._outer.reveal_child = True
-        utils.Timeout(
-            popup._outer.transition_duration, popup._inner.set_reveal_child, True
-        )
+        app_name = notification.app_name
+        group = self._groups_by_app.get(app_name)
+
+        if group is not None and group is self._groups[0]:
+            group.add(notification)
+            return
+
+        if not self.__within_rate(app_name):
+            if group is not None:
+                group.add(notification)
+            return
+
+        while len(self._groups) >= MAX_VISIBLE_POPUPS:
+            self._groups[-1].destroy(animate=False)
+
+        self._window.show_popups()
+        group = PopupGroup(box=self, notification=notification)
+        self._groups.insert(0, group)
+        self._groups_by_app[app_name] = group
+        self.prepend(group)
+        group.reveal()
 
 
 class NotificationPopup(widgets.Window):
-    def __init__(self, monitor: int):
+    """
+    Notification popup stack.
+
+    Without a monitor the window is a single host that moves to the
+    configured monitor, or the focused one, whenever it becomes visible.
+    """
+
+    def __init__(self, monitor: int | None = None):
+        self._follow_focus = monitor is None
+        namespace = "ignis_NOTIFICATION_POPUP"
+        if monitor is not None:
+            namespace += f"_{monitor}"
+
         super().__init__(
             anchor=["right", "top", "bottom"],
-            monitor=monitor,
-            namespace=f"ignis_NOTIFICATION_POPUP_{monitor}",
+            monitor=monitor or 0,
+            namespace=namespace,
             layer="top",
-            child=PopupBox(window=self, monitor=monitor),
+            child=PopupBox(window=self),
             visible=False,
             dynamic_input_region=True,
             css_classes=["unset"],
             style="min-width: 29rem;",
         )
+
+    def show_popups(self) -> None:
+        if self._follow_focus and not self.visible:
+            target = user_options.notifications.popup_monitor
+            if not 0 <= target < utils.get_n_monitors():
+                target = get_focused_monitor_id()
+            if self.monitor != target:
+                self.monitor = target
+        self.visible = True
@@ -6,13 +6,16 @@ from ignis.services.backlight import BacklightService
 from ignis.variable import Variable
 from ignis.window_manager import WindowManager
 
+from services.coalesced_setter import get_brightness_setter, get_volume_setter
+from services.monitors import get_focused_monitor_id
+
 from ..shared_widgets import Corner
 
 window_manager = WindowManager.get_default()
 
 
 class OsdWindow(widgets.RevealerWindow):
-    def __init__(self, state: dict, monitor_id: int = 0):
+    def __init__(self, state: dict):
         self.state = state
 
         # Create percentage label
@@ -117,7 +120,7 @@ class OsdWindow(widgets.RevealerWindow):
             layer="overlay",
             css_classes=["osd-window"],
             anchor=["top", "bottom", "right"],
-            namespace=f"ignis_OSD_{state['name']}_{monitor_id}",
+            namespace=f"ignis_{state['name']}",
             child=widgets.CenterBox(
                 hexpand=True,
                 halign="fill",
@@ -137,6 +140,8 @@ class OsdWindow(widgets.RevealerWindow):
 
     def _on_visibility_change(self, variable, param):
         if variable.value:
+            if not self.visible:
+                self.monitor = get_focused_monitor_id()
             # Show window first, then animate revealer
             self.set_visible(True)
             utils.Timeout(50, lambda: self.content_revealer.set_reveal_child(True))
@@ -150,107 +155,114 @@ class OsdWindow(widgets.RevealerWindow):
 
 
 class Osd:
-    def __init__(self, monitor_id: int = 0):
+    """
+    The shell's single OSD.
+
+    Volume and brightness share one window and one set of widgets; the
+    window moves to the focused monitor each time it is shown.
+    """
+
+    def __init__(self):
         self.service_inits()
-        self.monitor_id = monitor_id
 
-        # Backlight
         self.brightness_multiplier = 9
-        self.bl_state = {
-            "name": "BL",
+        # "volume" or "brightness", whichever changed last
+        self.mode = "volume"
+        self.state = {
+            "name": "OSD",
             "visible": Variable(value=False),
             "icon": Variable(value=""),
             "value": Variable(value=0.5),
-            "change": lambda x: setattr(
-                self.backlight,
-                "brightness",
-                log(1 + x.value * self.brightness_multiplier, e)
-                / log(1 + self.brightness_multiplier, e)
-                * self.backlight.max_brightness,
-            ),
+            "change": self.slider_change,
         }
+
         self.backlight.connect(
             "notify::brightness",
-            lambda x, y: self.brightness_change(),
+            lambda x, y: self.brightness_notified(),
         )
-
-        # Volume
-        self.vol_state = {
-            "name": "VOL",
-            "visible": Variable(value=False),
-            "icon": Variable(value=""),
-            "value": Variable(value=0.5),
-            "change": lambda x: setattr(
-                self.audio.speaker,
-                "volume",
-                x.value * 100,
-            ),
-        }
         self.audio.speaker.connect(
             "notify::volume",
-            lambda x, u: self.volume_change(x.volume / 100, x.is_muted),
+            lambda x, u: self.volume_notified(x),
         )
         self.audio.speaker.connect(
             "notify::is-muted",
             lambda x, u: self.volume_change(x.volume / 100, x.is_muted),
         )
 
-        self.osd_windows = {}
-        self.popup(self.bl_state)
-        self.popup(self.vol_state)
+        self.osd_window = OsdWindow(self.state)
 
     def service_inits(self):
         self.audio = AudioService.get_default()
         self.backlight = BacklightService.get_default()
+        self.volume_setter = get_volume_setter("speaker")
+        self.brightness_setter = get_brightness_setter()
 
-    def volume_change(self, volume, muted):
-        # Close brightness OSD if visible
-        if self.bl_state["visible"].value:
-            self.bl_state["visible"].value = False
+    def slider_change(self, scale):
+        # Programmatic updates of the bound value are not written back
+        if scale.value == self.state["value"].value:
+            return
+
+        if self.mode == "volume":
+            self.volume_setter.set(scale.value * 100)
+        else:
+            self.brightness_setter.set(
+                log(1 + scale.value * self.brightness_multiplier, e)
+                / log(1 + self.brightness_multiplier, e)
+                * self.backlight.max_brightness
+            )
 
+    def volume_notified(self, stream):
+        # Our own slider writes echo back; keep the OSD open without
+        # moving the slider under the pointer
+        if self.volume_setter.is_echo(stream.volume):
+            if self.state["visible"].value:
+                self.popup_debounce()
+            return
+        self.volume_change(stream.volume / 100, stream.is_muted)
+
+    def brightness_notified(self):
+        if self.brightness_setter.is_echo(self.backlight.brightness):
+            if self.state["visible"].value:
+                self.popup_debounce()
+            return
+        self.brightness_change()
+
+    def volume_change(self, volume, muted):
         volume *= 100
         if volume <= 0 or type(volume) is not float or muted:
-            self.vol_state["icon"].value = "audio-volume-muted-symbolic"
-        elif volume > 0 and volume <= 33:
-            self.vol_state["icon"].value = "audio-volume-low-symbolic"
-        elif volume > 33 and volume <= 66:
-            self.vol_state["icon"].value = "audio-volume-medium-symbolic"
-        elif volume > 66 and volume <= 100:
-            self.vol_state["icon"].value = "audio-volume-high-symbolic"
-        elif volume > 100:
-            self.vol_state["icon"].value = "audio-volume-overamplified-symbolic"
-        volume /= 100
-        self.vol_state["visible"].value = True
-        self.vol_state["value"].value = volume
-        self.vol_popup_debounce()
+            icon = "audio-volume-muted-symbolic"
+        elif volume <= 33:
+            icon = "audio-volume-low-symbolic"
+        elif volume <= 66:
+            icon = "audio-volume-medium-symbolic"
+        elif volume <= 100:
+            icon = "audio-volume-high-symbolic"
+        else:
+            icon = "audio-volume-overamplified-symbolic"
 
-    def brightness_change(self):
-        # Close volume OSD if visible
-        if self.vol_state["visible"].value:
-            self.vol_state["visible"].value = False
+        self.show("volume", icon, volume / 100)
 
+    def brightness_change(self):
         brightness_level = self.backlight.brightness / self.backlight.max_brightness
         if brightness_level <= 0.25:
-            self.bl_state["icon"].value = "display-brightness-low-symbolic"
+            icon = "display-brightness-low-symbolic"
         elif brightness_level <= 0.5:
-            self.bl_state["icon"].value = "display-brightness-medium-symbolic"
+            icon = "display-brightness-medium-symbolic"
         elif brightness_level <= 0.75:
-            self.bl_state["icon"].value = "display-brightness-high-symbolic"
+            icon = "display-brightness-high-symbolic"
         else:
-            self.bl_state["icon"].value = "display-brightness-symbolic"
+            icon = "display-brightness-symbolic"
 
-        self.bl_state["visible"].value = True
-        self.bl_state["value"].value = brightness_level
-        self.bl_popup_debounce()
+        self.show("brightness", icon, brightness_level)
 
-    @utils.debounce(3000)
-    def bl_popup_debounce(self):
-        self.bl_state["visible"].value = False
+    def show(self, mode: str, icon: str, value: float):
+        self.mode = mode
+        # Set before the value so the slider update is not written back
+        self.state["value"].value = value
+        self.state["icon"].value = icon
+        self.state["visible"].value = True
+        self.popup_debounce()
 
     @utils.debounce(3000)
-    def vol_popup_debounce(self):
-        self.vol_state["visible"].value = False
-
-    def popup(self, state: dict):
-        osd_window = OsdWindow(state, self.monitor_id)
-        self.osd_windows[state["name"]] = osd_window
+    def popup_debounce(self):
+        self.state["visible"].value = False
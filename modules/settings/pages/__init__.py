@@ -3,6 +3,7 @@ from .appearance import AppearanceEntry
 from .depth_effect import DepthEffectEntry
 from .desktop_widgets import DesktopWidgetsEntry
 from .draggables import DraggablesEntry
+from .idle_inhibitor import IdleInhibitorEntry
 from .notifications import NotificationsEntry
 from .recorder import RecorderEntry
 from .user import UserEntry
@@ -13,6 +14,7 @@ __all__ = [
     "DepthEffectEntry", 
     "DesktopWidgetsEntry",
     "DraggablesEntry",
+    "IdleInhibitorEntry",
     "NotificationsEntry",
     "RecorderEntry",
     "UserEntry",
@@ -134,6 +134,22 @@ class AppearanceEntry(SettingsEntry):
                             on_change=lambda x,
                             state: user_options.material.set_blur_enabled(state),
                         ),
+                        SwitchRow(
+                            label="Save blur to hyprland.conf",
+                            sublabel="Blur is applied at runtime; this also keeps it in the config file",
+                            active=user_options.material.bind("persist_hyprland_config"),
+                            on_change=lambda x,
+                            state: user_options.material.set_persist_hyprland_config(
+                                state
+                            ),
+                        ),
+                        SwitchRow(
+                            label="Theme Hyprland",
+                            sublabel="Apply border colors at runtime, overriding hyprland.conf",
+                            active=user_options.material.bind("theme_hyprland"),
+                            on_change=lambda x,
+                            state: user_options.material.set_theme_hyprland(state),
+                        ),
                         FileRow(
                             label="Wallpaper path",
                             button_label=os.path.basename(
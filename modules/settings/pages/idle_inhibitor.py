@@ -0,0 +1,37 @@
+from ..elements import SwitchRow, SettingsPage, SettingsGroup, SettingsEntry
+from user_options import user_options
+
+
+class IdleInhibitorEntry(SettingsEntry):
+    def __init__(self):
+        page = SettingsPage(
+            name="Idle Inhibitor",
+            groups=[
+                SettingsGroup(
+                    name="Automatic",
+                    rows=[
+                        SwitchRow(
+                            label="While playing video",
+                            sublabel="Keep awake while a media player is playing",
+                            active=user_options.idle_inhibitor.bind("auto_media"),
+                            on_change=lambda x,
+                            state: user_options.idle_inhibitor.set_auto_media(state),
+                        ),
+                        SwitchRow(
+                            label="While a window is fullscreen",
+                            sublabel="Keep awake while the focused window is fullscreen (Hyprland)",
+                            active=user_options.idle_inhibitor.bind("auto_fullscreen"),
+                            on_change=lambda x,
+                            state: user_options.idle_inhibitor.set_auto_fullscreen(
+                                state
+                            ),
+                        ),
+                    ],
+                ),
+            ],
+        )
+        super().__init__(
+            label="Idle Inhibitor",
+            icon="preferences-system-privacy-symbolic",
+            page=page,
+        )
@@ -1,5 +1,6 @@
 from ..elements import SwitchRow, SettingsPage, SettingsGroup, SpinRow, SettingsEntry
 from ignis.options import options
+from user_options import user_options
 
 
 class NotificationsEntry(SettingsEntry):
@@ -35,7 +36,30 @@ class NotificationsEntry(SettingsEntry):
                             value: options.notifications.set_popup_timeout(value),
                         ),
                     ],
-                )
+                ),
+                SettingsGroup(
+                    name="Popups",
+                    rows=[
+                        SpinRow(
+                            label="Popup monitor",
+                            sublabel="Monitor to show popups on, -1 follows the focused monitor",
+                            value=user_options.notifications.bind("popup_monitor"),
+                            min=-1,
+                            max=16,
+                            on_change=lambda x,
+                            value: user_options.notifications.set_popup_monitor(
+                                int(value)
+                            ),
+                        ),
+                        SwitchRow(
+                            label="Show popups on every monitor",
+                            sublabel="Takes effect after restarting",
+                            active=user_options.notifications.bind("mirror_popups"),
+                            on_change=lambda x,
+                            state: user_options.notifications.set_mirror_popups(state),
+                        ),
+                    ],
+                ),
             ],
         )
         super().__init__(
@@ -8,6 +8,7 @@ from .pages import (
     DepthEffectEntry,
     DesktopWidgetsEntry,
     DraggablesEntry,
+    IdleInhibitorEntry,
     NotificationsEntry,
     RecorderEntry,
     UserEntry,
@@ -59,6 +60,7 @@ class Settings(widgets.RegularWindow):
         rows = [
             NotificationsEntry(),
             RecorderEntry(),
+            IdleInhibitorEntry(),
             AppearanceEntry(),
             DepthEffectEntry(),
             DesktopWidgetsEntry(),
@@ -0,0 +1,92 @@
+from typing import Iterable
+
+import cairo
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+from ignis.base_widget import BaseWidget
+from ignis.gobject import IgnisProperty
+
+
+class HistoryGraph(Gtk.DrawingArea, BaseWidget):
+    """
+    Bases: :class:`Gtk.DrawingArea`
+
+    A filled line graph of a sample history, oldest sample on the left.
+
+    The graph does not copy the samples; call ``queue_draw()`` after the
+    history has been updated.
+
+    Args:
+        history: Iterable of samples with a ``size`` attribute (e.g. a ring buffer).
+        max_value: Value drawn at the top edge.
+        size: Requested ``(width, height)``.
+        **kwargs: Properties to set.
+    """
+
+    __gtype_name__ = "FluxHistoryGraph"
+    __gproperties__ = {**BaseWidget.gproperties}
+
+    def __init__(
+        self,
+        history: Iterable[float],
+        max_value: float = 100.0,
+        size: tuple[int, int] = (240, 60),
+        **kwargs,
+    ):
+        Gtk.DrawingArea.__init__(self)
+        self._history = history
+        self._max_value = max_value
+        BaseWidget.__init__(self, **kwargs)
+
+        self.set_size_request(size[0], size[1])
+        self.set_draw_func(self.__on_draw)
+
+    @IgnisProperty
+    def max_value(self) -> float:
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, value: float) -> None:
+        if value == 0:
+            raise ValueError("max_value cannot be zero")
+        self._max_value = value
+        self.queue_draw()
+
+    def __on_draw(
+        self, drawing_area, cr: cairo.Context, width: int, height: int, user_data=None
+    ):
+        color = self.get_color()
+        capacity = getattr(self._history, "size", 0)
+        if capacity < 2:
+            return
+
+        step = width / (capacity - 1)
+        # Right-align so the newest sample always sits on the right edge
+        x = width - (len(self._history) - 1) * step  # type: ignore
+
+        points = []
+        for value in self._history:
+            ratio = max(0.0, min(value / self._max_value, 1.0))
+            points.append((x, height - ratio * height))
+            x += step
+        if not points:
+            return
+
+        cr.save()
+        cr.move_to(points[0][0], height)
+        for px, py in points:
+            cr.line_to(px, py)
+        cr.line_to(points[-1][0], height)
+        cr.close_path()
+        cr.set_source_rgba(color.red, color.green, color.blue, color.alpha * 0.3)
+        cr.fill()
+
+        cr.set_line_width(1.5)
+        cr.move_to(*points[0])
+        for px, py in points[1:]:
+            cr.line_to(px, py)
+        cr.set_source_rgba(color.red, color.green, color.blue, color.alpha)
+        cr.stroke()
+        cr.restore()
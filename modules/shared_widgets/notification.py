@@ -1,34 +1,84 @@
 import os
-import sys
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "services"))
-import image_processor
-
-from ignis import widgets, utils
+from ignis import widgets
 from ignis.services.notifications import Notification
 
+from services.thumbnail_cache import ScreenshotPreviewCache, ThumbnailCache
 from user_options import user_options
-from gi.repository import GdkPixbuf
 
+thumbnail_cache = ThumbnailCache.get_default()
+screenshot_previews = ScreenshotPreviewCache.get_default()
 
-def crop_to_square(image_path: str) -> str:
-    """
-    Crop an image to square aspect ratio and return the path to the cropped image.
-    """
-    return image_processor.crop_to_square(image_path)
+PLACEHOLDER_ICON = "dialog-information-symbolic"
 
 
 class CroppedPicture(widgets.Picture):
-    """Picture widget that automatically crops images to square aspect ratio."""
+    """
+    Picture widget that shows image files as square cached thumbnails.
+
+    A placeholder icon is shown until the thumbnail has been generated;
+    icon names are displayed as is.
+    """
 
     def __init__(self, image=None, **kwargs):
-        if image and isinstance(image, str):
-            image = crop_to_square(image)
-        super().__init__(image=image, **kwargs)
+        self._source: str | None = None
+        super().__init__(**kwargs)
+        self.set_image(image)
+
+    def set_image(self, image) -> None:
+        """Show ``image``, going through the thumbnail cache for files"""
+        self._source = None
+        if isinstance(image, str):
+            path = image.removeprefix("file://")
+            if os.path.isabs(path):
+                self._source = path
+                image = PLACEHOLDER_ICON
+        self.image = image
+
+        if self._source:
+            source = self._source
+            thumbnail_cache.request(
+                source, lambda path: self.__on_thumbnail(source, path)
+            )
+
+    def __on_thumbnail(self, source: str, path: str) -> None:
+        # The picture may have been rebound to another image meanwhile
+        if source == self._source:
+            self.image = path
+
+
+def _action_buttons(notification: Notification) -> list[widgets.Button]:
+    return [
+        widgets.Button(
+            child=widgets.Label(label=action.label),
+            on_click=lambda x, action=action: action.invoke(),
+            css_classes=["notification-action"],
+        )
+        for action in notification.actions
+    ]
 
 
 class ScreenshotLayout(widgets.Box):
-    def __init__(self, notification: Notification) -> None:
+    def __init__(self, notification: Notification | None = None) -> None:
+        self._notification: Notification | None = None
+
+        self._preview = widgets.Picture(
+            css_classes=["notification-icon"],
+            width=1920 // 7,
+            height=1080 // 7,
+        )
+        self._summary = widgets.Label(
+            ellipsize="end",
+            halign="center",
+            css_classes=["notification-summary"],
+        )
+        self._body = widgets.Label(
+            ellipsize="end",
+            halign="center",
+            css_classes=["notification-body"],
+        )
+        self._actions = widgets.Box(homogeneous=True, spacing=10)
+
         super().__init__(
             vertical=True,
             hexpand=True,
@@ -39,16 +89,7 @@ class ScreenshotLayout(widgets.Box):
                     vertical=True,
                     child=[
                         widgets.Overlay(
-                            child=widgets.Picture(
-                                image=utils.crop_pixbuf(
-                                    GdkPixbuf.Pixbuf.new_from_file(notification.icon),
-                                    1920 // 4,
-                                    1080 // 4,
-                                ),
-                                css_classes=["notification-icon"],
-                                width=1920 // 7,
-                                height=1080 // 7,
-                            ),
+                            child=self._preview,
                             overlays=[
                                 widgets.Button(
                                     child=widgets.Icon(
@@ -60,7 +101,7 @@ class ScreenshotLayout(widgets.Box):
                                     valign="start",
                                     hexpand=True,
                                     css_classes=["notification-close"],
-                                    on_click=lambda x: notification.close(),
+                                    on_click=lambda x: self.__close(),
                                 ),
                             ],
                         ),
@@ -69,43 +110,44 @@ class ScreenshotLayout(widgets.Box):
                             hexpand=True,
                             halign="center",
                             style="margin-left: 0.75rem;",
-                            child=[
-                                widgets.Label(
-                                    ellipsize="end",
-                                    label=notification.summary,
-                                    halign="center",
-                                    visible=notification.summary != "",
-                                    css_classes=["notification-summary"],
-                                ),
-                                widgets.Label(
-                                    label=notification.body,
-                                    ellipsize="end",
-                                    halign="center",
-                                    css_classes=["notification-body"],
-                                    visible=notification.body != "",
-                                ),
-                            ],
-                        ),
-                        widgets.Box(
-                            child=[
-                                widgets.Button(
-                                    child=widgets.Label(label=action.label),
-                                    on_click=lambda x, action=action: action.invoke(),
-                                    css_classes=["notification-action"],
-                                )
-                                for action in notification.actions
-                            ],
-                            homogeneous=True,
-                            style="margin-top: 0.75rem;"
-                            if notification.actions
-                            else "",
-                            spacing=10,
+                            child=[self._summary, self._body],
                         ),
+                        self._actions,
                     ],
                 ),
             ],
         )
 
+        if notification is not None:
+            self.bind(notification)
+
+    def bind(self, notification: Notification) -> None:
+        """Show ``notification``, reusing the existing widgets"""
+        self._notification = notification
+        self._summary.label = notification.summary
+        self._summary.visible = notification.summary != ""
+        self._body.label = notification.body
+        self._body.visible = notification.body != ""
+        self._actions.child = _action_buttons(notification)
+        self._actions.style = "margin-top: 0.75rem;" if notification.actions else ""
+
+        self._preview.set_paintable(None)
+        screenshot_previews.request(
+            notification,
+            lambda texture: self.__on_preview(notification, texture),
+        )
+
+    def unbind(self) -> None:
+        self._notification = None
+
+    def __on_preview(self, notification: Notification, texture) -> None:
+        if texture and notification is self._notification:
+            self._preview.set_paintable(texture)
+
+    def __close(self) -> None:
+        if self._notification is not None:
+            self._notification.close()
+
 
 # class ScreenshotLayout(widgets.Box):
 #     def __init__(self, notification: Notification) -> None:
@@ -164,7 +206,30 @@ class ScreenshotLayout(widgets.Box):
 
 
 class NormalLayout(widgets.Box):
-    def __init__(self, notification: Notification) -> None:
+    def __init__(self, notification: Notification | None = None) -> None:
+        self._notification: Notification | None = None
+
+        self._icon = CroppedPicture(
+            css_classes=["notification-icon"],
+            image=PLACEHOLDER_ICON,
+            height=42,
+            width=42,
+            halign="start",
+            valign="start",
+        )
+        self._summary = widgets.Label(
+            ellipsize="end",
+            use_markup=True,
+            halign="start",
+            css_classes=["notification-summary"],
+        )
+        self._body = widgets.Label(
+            ellipsize="end",
+            halign="start",
+            css_classes=["notification-body"],
+        )
+        self._actions = widgets.Box(homogeneous=True, spacing=10)
+
         super().__init__(
             vertical=True,
             hexpand=True,
@@ -172,36 +237,11 @@ class NormalLayout(widgets.Box):
             child=[
                 widgets.Box(
                     child=[
-                        CroppedPicture(
-                            css_classes=["notification-icon"],
-                            image=notification.icon
-                            if notification.icon
-                            else "dialog-information-symbolic",
-                            height=42,
-                            width=42,
-                            halign="start",
-                            valign="start",
-                        ),
+                        self._icon,
                         widgets.Box(
                             vertical=True,
                             style="margin-left: 0.75rem;",
-                            child=[
-                                widgets.Label(
-                                    ellipsize="end",
-                                    label=f"{notification.summary} | <span color={"'#999'" if user_options.material.dark_mode else "'#111'"}>{notification.app_name}</span>",
-                                    use_markup=True,
-                                    halign="start",
-                                    visible=notification.summary != "",
-                                    css_classes=["notification-summary"],
-                                ),
-                                widgets.Label(
-                                    label=notification.body,
-                                    ellipsize="end",
-                                    halign="start",
-                                    css_classes=["notification-body"],
-                                    visible=notification.body != "",
-                                ),
-                            ],
+                            child=[self._summary, self._body],
                         ),
                         widgets.Button(
                             child=widgets.Icon(
@@ -213,40 +253,80 @@ class NormalLayout(widgets.Box):
                             valign="start",
                             hexpand=True,
                             css_classes=["notification-close"],
-                            on_click=lambda x: notification.close(),
+                            on_click=lambda x: self.__close(),
                         ),
                     ],
                 ),
-                widgets.Box(
-                    child=[
-                        widgets.Button(
-                            child=widgets.Label(label=action.label),
-                            on_click=lambda x, action=action: action.invoke(),
-                            css_classes=["notification-action"],
-                        )
-                        for action in notification.actions
-                    ],
-                    homogeneous=True,
-                    style="margin-top: 0.75rem;" if notification.actions else "",
-                    spacing=10,
-                ),
+                self._actions,
             ],
         )
 
+        if notification is not None:
+            self.bind(notification)
+
+    def bind(self, notification: Notification) -> None:
+        """Show ``notification``, reusing the existing widgets"""
+        self._notification = notification
+        self._icon.set_image(notification.icon or PLACEHOLDER_ICON)
+
+        color = "'#999'" if user_options.material.dark_mode else "'#111'"
+        self._summary.label = (
+            f"{notification.summary} | <span color={color}>{notification.app_name}</span>"
+        )
+        self._summary.visible = notification.summary != ""
+        self._body.label = notification.body
+        self._body.visible = notification.body != ""
+        self._actions.child = _action_buttons(notification)
+        self._actions.style = "margin-top: 0.75rem;" if notification.actions else ""
+
+    def unbind(self) -> None:
+        self._notification = None
+
+    def __close(self) -> None:
+        if self._notification is not None:
+            self._notification.close()
+
 
 class NotificationWidget(widgets.Box):
-    def __init__(self, notification: Notification) -> None:
-        layout: NormalLayout | ScreenshotLayout
+    """
+    A notification card that can be rebound to another notification.
 
+    ``bind()`` updates the labels, icon and actions in place; the normal and
+    screenshot layouts are each built at most once per widget.
+    """
+
+    def __init__(self, notification: Notification | None = None) -> None:
+        self._normal: NormalLayout | None = None
+        self._screenshot: ScreenshotLayout | None = None
+        self._layout: NormalLayout | ScreenshotLayout | None = None
+
+        super().__init__(css_classes=["notification"])
+
+        if notification is not None:
+            self.bind(notification)
+
+    def bind(self, notification: Notification) -> None:
+        """Show ``notification`` in this widget"""
         if (
             notification.app_name in user_options.default.screenshot_app
             and notification.icon
         ):
-            layout = ScreenshotLayout(notification)
+            if self._screenshot is None:
+                self._screenshot = ScreenshotLayout()
+            layout: NormalLayout | ScreenshotLayout = self._screenshot
         else:
-            layout = NormalLayout(notification)
+            if self._normal is None:
+                self._normal = NormalLayout()
+            layout = self._normal
 
-        super().__init__(
-            css_classes=["notification"],
-            child=[layout],
-        )
+        if layout is not self._layout:
+            if self._layout is not None:
+                self._layout.unbind()
+            self.child = [layout]
+            self._layout = layout
+        layout.bind(notification)
+
+    def unbind(self) -> None:
+        """Forget the bound notification so late updates are ignored"""
+        if self._layout is not None:
+            self._layout.unbind()
@@ -1,18 +1,43 @@
 from ignis import widgets
 from ignis.services.audio import AudioService, Stream
 
+from services.coalesced_setter import CoalescedSetter
+
 audio = AudioService.get_default()
 
 
 class MaterialVolumeSlider(widgets.Scale):
-    def __init__(self, stream: Stream, **kwargs):
+    """
+    Volume slider for ``stream``.
+
+    Writes go through ``setter``; volume notifications that echo its own
+    writes are ignored so the handle does not jump back while dragging.
+    """
+
+    def __init__(self, stream: Stream, setter: CoalescedSetter, **kwargs):
+        self._stream = stream
+        self._setter = setter
+
         super().__init__(
-            value=stream.bind_many(
-                ["volume", "is_muted"],
-                lambda volume, is_muted: 0 if is_muted or volume is None else volume,
-            ),
+            value=self.__displayed_volume(),
             css_classes=["material-slider"],
             hexpand=True,
             step=5,
+            on_change=lambda x: self.__on_change(),
             **kwargs,
         )
+
+        stream.connect("notify::volume", lambda *_: self.__sync())
+        stream.connect("notify::is-muted", lambda *_: self.__sync(force=True))
+
+    def __displayed_volume(self) -> float:
+        volume = self._stream.volume
+        return 0 if self._stream.is_muted or volume is None else volume
+
+    def __sync(self, force: bool = False) -> None:
+        if force or not self._setter.is_echo(self._stream.volume or 0):
+            self.value = self.__displayed_volume()
+
+    def __on_change(self) -> None:
+        if self.value != self.__displayed_volume():
+            self._setter.set(self.value)
@@ -0,0 +1,105 @@
+import datetime
+import re
+import time
+
+from gi.repository import Gio, GLib
+from ignis.base_service import BaseService
+from ignis.variable import Variable
+
+from .sleep_monitor import SleepMonitorService
+
+# strftime directives whose output changes within a day
+SECOND_DIRECTIVES = set("STXcrs")
+MINUTE_DIRECTIVES = set("HIMpPRklT")
+
+DIRECTIVE_RE = re.compile(r"%[-_0^#]?([a-zA-Z])")
+
+# Fire slightly after the boundary so the new value is already visible
+BOUNDARY_SLACK = 0.05  # s
+
+
+def _granularity(fmt: str) -> int:
+    """Seconds between possible changes of ``strftime(fmt)`` (86400 = daily)"""
+    directives = set(DIRECTIVE_RE.findall(fmt))
+    if directives & SECOND_DIRECTIVES:
+        return 1
+    if directives & MINUTE_DIRECTIVES:
+        return 60
+    return 86400
+
+
+def _seconds_until_boundary(granularity: int) -> float:
+    now = time.time()
+    if granularity < 86400:
+        return granularity - now % granularity + BOUNDARY_SLACK
+
+    today = datetime.datetime.now()
+    tomorrow = (today + datetime.timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return (tomorrow - today).total_seconds() + BOUNDARY_SLACK
+
+
+class ClockService(BaseService):
+    """
+    A single wall-clock ticker shared by every time and date display.
+
+    ``format()`` returns a shared :class:`Variable` per strftime format. One
+    timer is aligned to the next boundary that can change any registered
+    format (second, minute or midnight), and a Variable is only set when its
+    text actually changes. The clock is re-synced after resume and when
+    ``/etc/localtime`` changes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._formats: dict[str, Variable] = {}
+        self._granularity = 86400
+        self._timeout_id = 0
+
+        SleepMonitorService.get_default().connect("resumed", lambda x: self.refresh())
+
+        self._tz_monitor = Gio.File.new_for_path("/etc/localtime").monitor_file(
+            Gio.FileMonitorFlags.WATCH_MOVES, None
+        )
+        self._tz_monitor.connect("changed", self.__on_timezone_changed)
+
+    def format(self, fmt: str) -> Variable:
+        """Return a Variable holding ``strftime(fmt)`` of the current time"""
+        variable = self._formats.get(fmt)
+        if variable is None:
+            variable = Variable(value=datetime.datetime.now().strftime(fmt))
+            self._formats[fmt] = variable
+
+            granularity = _granularity(fmt)
+            if granularity < self._granularity or not self._timeout_id:
+                self._granularity = min(granularity, self._granularity)
+                self.__schedule()
+
+        return variable
+
+    def refresh(self) -> None:
+        """Recompute every format now and realign the timer"""
+        now = datetime.datetime.now()
+        for fmt, variable in self._formats.items():
+            text = now.strftime(fmt)
+            if variable.value != text:
+                variable.value = text
+
+        self.__schedule()
+
+    def __schedule(self) -> None:
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+
+        delay = _seconds_until_boundary(self._granularity)
+        self._timeout_id = GLib.timeout_add(int(delay * 1000), self.__on_tick)
+
+    def __on_tick(self) -> bool:
+        self._timeout_id = 0
+        self.refresh()
+        return GLib.SOURCE_REMOVE
+
+    def __on_timezone_changed(self, monitor, file, other_file, event) -> None:
+        time.tzset()
+        self.refresh()
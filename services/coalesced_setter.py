@@ -0,0 +1,112 @@
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Literal
+
+from ignis import utils
+from ignis.services.audio import AudioService
+from ignis.services.backlight import BacklightService
+
+# Writes are paced to at most one per frame
+FRAME_INTERVAL = 16  # ms
+
+# A notification matching a value written within this window is an echo
+ECHO_WINDOW = 0.5  # s
+
+_UNSET = object()
+
+
+class CoalescedSetter:
+    """
+    Rate-limited writer for a value driven by a slider.
+
+    At most one write is in flight; values set meanwhile replace each other
+    and only the latest is written, at most once per ``FRAME_INTERVAL``.
+    ``apply`` may return an awaitable, which is awaited before the next write.
+
+    Args:
+        apply: Writes a value to the backing service.
+        tolerance: Maximum difference for a notified value to count as an echo.
+    """
+
+    def __init__(self, apply: Callable[[float], Any], tolerance: float = 0.0):
+        self._apply = apply
+        self._tolerance = tolerance
+        self._pending: Any = _UNSET
+        self._in_flight = False
+        self._timeout: utils.Timeout | None = None
+        self._last_value: float | None = None
+        self._last_write = 0.0
+        self._written: list[tuple[float, float]] = []
+
+    @property
+    def busy(self) -> bool:
+        """Whether a write is in flight or queued"""
+        return self._in_flight or self._timeout is not None or self._pending is not _UNSET
+
+    def set(self, value: float) -> None:
+        if not self.busy and value == self._last_value:
+            return
+        self._pending = value
+        if not self._in_flight and self._timeout is None:
+            self.__flush()
+
+    def is_echo(self, value: float) -> bool:
+        """
+        Whether ``value`` is the service reporting one of our recent writes.
+        Only the values written within ``ECHO_WINDOW`` count, so an external
+        change during a drag is still reported.
+        """
+        cutoff = time.monotonic() - ECHO_WINDOW
+        self._written = [(t, v) for t, v in self._written if t >= cutoff]
+        return any(
+            abs(value - written) <= self._tolerance for _, written in self._written
+        )
+
+    def __flush(self) -> None:
+        if self._pending is _UNSET:
+            return
+        value, self._pending = self._pending, _UNSET
+
+        self._in_flight = True
+        self._last_value = value
+        self._written.append((time.monotonic(), value))
+
+        try:
+            result = self._apply(value)
+        except Exception as e:
+            print(f"Error applying value {value}: {e}")
+            result = None
+
+        if asyncio.iscoroutine(result):
+            task = asyncio.create_task(result)
+            task.add_done_callback(lambda _: self.__on_written())
+        else:
+            self.__on_written()
+
+    def __on_written(self) -> None:
+        self._in_flight = False
+        self._timeout = utils.Timeout(FRAME_INTERVAL, self.__on_frame)
+
+    def __on_frame(self) -> None:
+        self._timeout = None
+        self.__flush()
+
+
+@functools.cache
+def get_volume_setter(stream_type: Literal["speaker", "microphone"]) -> CoalescedSetter:
+    """Shared setter for the default speaker or microphone volume (0-100)"""
+    audio = AudioService.get_default()
+    # The default stream is looked up on every write, it can change at runtime
+    return CoalescedSetter(
+        lambda value: getattr(audio, stream_type).set_volume(value), tolerance=1.0
+    )
+
+
+@functools.cache
+def get_brightness_setter() -> CoalescedSetter:
+    """Shared setter for the backlight brightness, in raw device units"""
+    backlight = BacklightService.get_default()
+    return CoalescedSetter(
+        lambda value: backlight.set_brightness_async(int(value)), tolerance=1.0
+    )
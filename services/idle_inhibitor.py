@@ -1,153 +1,469 @@
-import subprocess
+import os
+import shutil
 import sys
 from signal import SIGINT, SIGTERM, signal
 
-from gi.repository import GObject
+from gi.repository import Gio, GLib, GObject, Gtk
+from ignis import utils
 from ignis.base_service import BaseService
 
+from user_options import user_options
+
+LOGIND_BUS_NAME = "org.freedesktop.login1"
+LOGIND_PATH = "/org/freedesktop/login1"
+LOGIND_MANAGER = "org.freedesktop.login1.Manager"
+
+INHIBIT_WHAT = "idle:sleep"
+INHIBIT_WHO = "ignis"
+INHIBIT_WHY = "User requested idle inhibition"
+
+# MPRIS players whose playback counts as watching a video (identity or
+# desktop entry, lowercase). Browsers are left out since they also report
+# audio-only playback; fullscreen browser video is covered by auto_fullscreen
+VIDEO_PLAYERS = (
+    "mpv",
+    "vlc",
+    "celluloid",
+    "io.github.celluloid_player.celluloid",
+    "totem",
+    "org.gnome.totem",
+    "haruna",
+    "org.kde.haruna",
+    "smplayer",
+    "jellyfin",
+    "freetube",
+)
+
+# Automatic inhibition is kept this long after its condition ends, so short
+# pauses or leaving fullscreen briefly do not flap the lock
+AUTO_RELEASE_DELAY = 30_000  # ms
+
+# Hyprland's fullscreen state is a bitmask; 1 is maximized, 2 is fullscreen
+HYPRLAND_FULLSCREEN = 2
+
 
 class IdleInhibitorService(BaseService):
     """
-    Service for managing idle inhibition using wlinhibit or systemd-inhibit.
-    
-    Prevents the system from going idle/sleeping when activated.
+    Service for managing idle inhibition.
+
+    Idle is inhibited in-process with ``Gtk.Application.inhibit()`` on a bar
+    window, which uses the Wayland idle-inhibit protocol that idle daemons
+    such as swayidle and hypridle honour. Alongside it, a logind inhibitor
+    lock is taken through ``org.freedesktop.login1.Manager.Inhibit`` to block
+    sleep; the returned file descriptor is held and closing it releases the
+    lock. ``wlinhibit`` is only spawned as a last resort when GTK cannot
+    inhibit. Nothing blocks the main loop.
+
+    Besides the manual toggle, inhibition can be enabled automatically while
+    an MPRIS video player is playing or the active Hyprland window is
+    fullscreen (see the ``idle_inhibitor`` user options). Both sources are
+    tracked separately; the lock is held while either wants it.
     """
-    
+
     def __init__(self):
         super().__init__()
         self._is_inhibiting = False
-        self._inhibit_process = None
-        self._inhibit_method = self._detect_inhibit_method()
-        self._available = self._inhibit_method is not None
+        self._manual = False
+        self._auto = False
+        self._auto_release: utils.Timeout | None = None
+        self._auto_sources: set[str] = set()
+        self._watched_window = None
+        self._watched_window_handler = 0
+        self._wlinhibit = shutil.which("wlinhibit")
+        self._wlinhibit_failed = False
+        # None until the system bus has been checked for logind
+        self._logind: bool | None = None
+        self._bus: Gio.DBusConnection | None = None
+
+        self._inhibit_cookie = 0
+        self._inhibit_fd: int | None = None
+        self._inhibit_call_pending = False
+        self._inhibit_process: Gio.Subprocess | None = None
+
+        Gio.bus_get(Gio.BusType.SYSTEM, None, self.__on_bus_acquired)
 
         signal(SIGINT, self._on_signal)
         signal(SIGTERM, self._on_signal)
 
+        options = user_options.idle_inhibitor
+        options.connect_option("auto_media", lambda: self.__on_option_changed())
+        options.connect_option("auto_fullscreen", lambda: self.__on_option_changed())
+        self.__setup_auto()
+        self.__evaluate_auto()
+
     def _on_signal(self, *args):
         self.cleanup()
         sys.exit(0)
 
-    def _detect_inhibit_method(self) -> str | None:
-        """Detect which idle inhibition method is available"""
-        # Try wlinhibit first (best for Wayland)
+    def __on_bus_acquired(self, source, result: Gio.AsyncResult) -> None:
         try:
-            subprocess.run(['wlinhibit', '--help'], capture_output=True, check=True)
-            return 'wlinhibit'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-            
-        # Try systemd-inhibit as fallback
+            self._bus = Gio.bus_get_finish(result)
+        except GLib.Error:
+            self.__on_detected(False)
+            return
+
+        self._bus.call(
+            "org.freedesktop.DBus",
+            "/org/freedesktop/DBus",
+            "org.freedesktop.DBus",
+            "NameHasOwner",
+            GLib.Variant("(s)", (LOGIND_BUS_NAME,)),
+            GLib.VariantType("(b)"),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self.__on_name_has_owner,
+        )
+
+    def __on_name_has_owner(self, bus: Gio.DBusConnection, result) -> None:
         try:
-            subprocess.run(['systemd-inhibit', '--help'], capture_output=True, check=True)
-            return 'systemd-inhibit'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-            
-        return None
+            (has_owner,) = bus.call_finish(result).unpack()
+        except GLib.Error:
+            has_owner = False
+        self.__on_detected(has_owner)
+
+    def __on_detected(self, logind: bool) -> None:
+        was_available = self.available
+        self._logind = logind
+        if self.available != was_available:
+            self.notify("available")
+        self.__update()
 
     @GObject.Property(type=bool, default=False)
     def is_inhibiting(self) -> bool:
         """Whether idle inhibition is currently active"""
         return self._is_inhibiting
 
+    @GObject.Property(type=bool, default=False)
+    def manual(self) -> bool:
+        """Whether inhibition was turned on by the user"""
+        return self._manual
+
+    @GObject.Property(type=bool, default=False)
+    def auto_inhibiting(self) -> bool:
+        """Whether inhibition is requested by media playback or fullscreen"""
+        return self._auto
+
     @GObject.Property(type=bool, default=False)
     def available(self) -> bool:
         """Whether idle inhibition is available on this system"""
-        return self._available
+        return (
+            bool(self._logind)
+            or self._wlinhibit is not None
+            or isinstance(Gio.Application.get_default(), Gtk.Application)
+        )
 
     def start_inhibiting(self) -> bool:
         """
         Start inhibiting idle/sleep
-        
+
         Returns:
             bool: True if inhibition started successfully
         """
-        if not self._available or self._is_inhibiting:
-            return False
-            
-        try:
-            if self._inhibit_method == 'wlinhibit':
-                # Start wlinhibit as a background process
-                self._inhibit_process = subprocess.Popen(
-                    ['wlinhibit'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            elif self._inhibit_method == 'systemd-inhibit':
-                # Use systemd-inhibit to prevent idle and sleep
-                self._inhibit_process = subprocess.Popen(
-                    ['systemd-inhibit', '--what=idle:sleep', '--who=ignis', 
-                     '--why=User requested idle inhibition', 'sleep', 'infinity'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            else:
-                return False
-                
-            self._is_inhibiting = True
-            self.notify("is_inhibiting")
-            return True
-        except Exception:
+        if not self.available or self._manual:
             return False
 
+        self._manual = True
+        self.notify("manual")
+        self.__update()
+        return True
+
     def stop_inhibiting(self) -> bool:
         """
         Stop inhibiting idle/sleep
-        
+
         Returns:
             bool: True if inhibition stopped successfully
         """
-        if not self._is_inhibiting or self._inhibit_process is None:
+        if not self._manual:
             return False
-            
-        try:
-            self._inhibit_process.terminate()
-            self._inhibit_process.wait(timeout=2)
-            self._inhibit_process = None
-            self._is_inhibiting = False
-            self.notify("is_inhibiting")
-            return True
-        except Exception:
-            # Force kill if terminate doesn't work
-            try:
-                if self._inhibit_process:
-                    self._inhibit_process.kill()
-                    self._inhibit_process = None
-                self._is_inhibiting = False
-                self.notify("is_inhibiting")
-                return True
-            except Exception:
-                return False
+
+        self._manual = False
+        self.notify("manual")
+        self.__update()
+        return True
 
     def toggle(self) -> bool:
         """
-        Toggle idle inhibition state
-        
+        Toggle the manual idle inhibition
+
         Returns:
             bool: New inhibition state
         """
-        if self._is_inhibiting:
+        if self._manual:
             self.stop_inhibiting()
         else:
             self.start_inhibiting()
         return self._is_inhibiting
 
+    def __update(self) -> None:
+        inhibiting = self.available and (self._manual or self._auto)
+        if inhibiting != self._is_inhibiting:
+            self._is_inhibiting = inhibiting
+            self.notify("is_inhibiting")
+        self._apply()
+
+    def __setup_auto(self) -> None:
+        """Subscribe to the services needed by the enabled automatic sources"""
+        options = user_options.idle_inhibitor
+
+        if options.auto_media and "media" not in self._auto_sources:
+            from ignis.services.mpris import MprisService
+
+            mpris = MprisService.get_default()
+            mpris.connect("player_added", lambda x, player: self.__watch_player(player))
+            for player in mpris.players:
+                self.__watch_player(player)
+            self._auto_sources.add("media")
+
+        if options.auto_fullscreen and "fullscreen" not in self._auto_sources:
+            from ignis.services.hyprland import HyprlandService
+
+            hyprland = HyprlandService.get_default()
+            if hyprland.is_available:
+                hyprland.connect(
+                    "notify::active-window", lambda *_: self.__watch_active_window()
+                )
+                self.__watch_active_window()
+            self._auto_sources.add("fullscreen")
+
+    def __on_option_changed(self) -> None:
+        self.__setup_auto()
+        # The user turned a source off: do not wait for AUTO_RELEASE_DELAY
+        self.__evaluate_auto(release_now=True)
+
+    def __watch_player(self, player) -> None:
+        player.connect("notify::playback-status", lambda *_: self.__evaluate_auto())
+        player.connect("closed", lambda *_: self.__evaluate_auto())
+        self.__evaluate_auto()
+
+    def __watch_active_window(self) -> None:
+        from ignis.services.hyprland import HyprlandService
+
+        window = HyprlandService.get_default().active_window
+        if window is not self._watched_window:
+            if self._watched_window is not None and self._watched_window_handler:
+                self._watched_window.disconnect(self._watched_window_handler)
+            self._watched_window = window
+            self._watched_window_handler = (
+                window.connect("notify::fullscreen", lambda *_: self.__evaluate_auto())
+                if window is not None
+                else 0
+            )
+        self.__evaluate_auto()
+
+    def __is_playing_video(self) -> bool:
+        from ignis.services.mpris import MprisService
+
+        for player in MprisService.get_default().players:
+            if player.playback_status != "Playing":
+                continue
+            names = {
+                (player.identity or "").lower(),
+                (player.desktop_entry or "").lower(),
+            }
+            if names & set(VIDEO_PLAYERS):
+                return True
+        return False
+
+    def __is_fullscreen(self) -> bool:
+        fullscreen = getattr(self._watched_window, "fullscreen", 0)
+        return int(fullscreen or 0) >= HYPRLAND_FULLSCREEN
+
+    def __evaluate_auto(self, release_now: bool = False) -> None:
+        options = user_options.idle_inhibitor
+        wanted = (options.auto_media and self.__is_playing_video()) or (
+            options.auto_fullscreen and self.__is_fullscreen()
+        )
+
+        if wanted:
+            if self._auto_release:
+                self._auto_release.cancel()
+                self._auto_release = None
+            self.__set_auto(True)
+        elif release_now:
+            if self._auto_release:
+                self._auto_release.cancel()
+                self._auto_release = None
+            self.__set_auto(False)
+        elif self._auto and not self._auto_release:
+            self._auto_release = utils.Timeout(
+                AUTO_RELEASE_DELAY, self.__on_auto_release
+            )
+
+    def __on_auto_release(self) -> None:
+        self._auto_release = None
+        self.__set_auto(False)
+
+    def __set_auto(self, value: bool) -> None:
+        if value != self._auto:
+            self._auto = value
+            self.notify("auto_inhibiting")
+            self.__update()
+
+    def _apply(self) -> None:
+        """Take or release the lock so it matches ``is_inhibiting``"""
+        if self._is_inhibiting:
+            self.__acquire()
+        else:
+            self.__release()
+
+    def __acquire(self) -> None:
+        if not self._inhibit_cookie:
+            self.__inhibit_gtk()
+
+        if (
+            not self._inhibit_cookie
+            and self._inhibit_process is None
+            and self._wlinhibit
+            and not self._wlinhibit_failed
+        ):
+            self.__spawn_wlinhibit()
+
+        if self._inhibit_fd is not None or self._inhibit_call_pending:
+            return
+
+        if self._logind and self._bus:
+            self._inhibit_call_pending = True
+            self._bus.call_with_unix_fd_list(
+                LOGIND_BUS_NAME,
+                LOGIND_PATH,
+                LOGIND_MANAGER,
+                "Inhibit",
+                GLib.Variant("(ssss)", (INHIBIT_WHAT, INHIBIT_WHO, INHIBIT_WHY, "block")),
+                GLib.VariantType("(h)"),
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+                None,
+                self.__on_inhibit_reply,
+            )
+        elif (
+            self._logind is False
+            and not self._inhibit_cookie
+            and self._inhibit_process is None
+        ):
+            self.__on_failed()
+        # Otherwise detection is still running and will call _apply()
+
+    def __inhibit_gtk(self) -> None:
+        app = Gio.Application.get_default()
+        if not isinstance(app, Gtk.Application):
+            return
+
+        # Any mapped bar surface will do; the inhibitor lasts while it is shown
+        window = next(
+            (
+                window
+                for window in app.get_windows()
+                if (getattr(window, "namespace", None) or "").startswith("ignis_BAR_")
+                and window.get_mapped()
+            ),
+            None,
+        )
+        if window is None:
+            return
+
+        self._inhibit_cookie = app.inhibit(
+            window, Gtk.ApplicationInhibitFlags.IDLE, INHIBIT_WHY
+        )
+
+    def __on_inhibit_reply(self, bus: Gio.DBusConnection, result) -> None:
+        self._inhibit_call_pending = False
+        try:
+            reply, fd_list = bus.call_with_unix_fd_list_finish(result)
+            (index,) = reply.unpack()
+            self._inhibit_fd = fd_list.get(index)
+        except GLib.Error as e:
+            print(f"Failed to take a logind inhibitor lock: {e.message}")
+            self._logind = False
+            if self._is_inhibiting:
+                self.__acquire()
+            return
+
+        # Inhibition may have been turned off while the call was in flight
+        if not self._is_inhibiting:
+            self.__release()
+
+    def __spawn_wlinhibit(self) -> None:
+        try:
+            process = Gio.Subprocess.new(
+                [self._wlinhibit],  # type: ignore
+                Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE,
+            )
+        except GLib.Error as e:
+            print(f"Failed to start wlinhibit: {e.message}")
+            self._wlinhibit_failed = True
+            return
+
+        self._inhibit_process = process
+        # Also reaps the child once it has been terminated by __release()
+        process.wait_async(None, self.__on_wlinhibit_exited)
+
+    def __on_wlinhibit_exited(self, process: Gio.Subprocess, result) -> None:
+        try:
+            process.wait_finish(result)
+        except GLib.Error:
+            pass
+        if process is not self._inhibit_process:
+            return
+
+        # Exited on its own, e.g. the compositor lacks idle-inhibit support
+        print("wlinhibit exited unexpectedly")
+        self._inhibit_process = None
+        self._wlinhibit_failed = True
+        if self._is_inhibiting:
+            self.__acquire()
+
+    def __on_failed(self) -> None:
+        """No backend could inhibit; reflect that in every state flag"""
+        if self._auto_release:
+            self._auto_release.cancel()
+            self._auto_release = None
+        if self._manual:
+            self._manual = False
+            self.notify("manual")
+        if self._auto:
+            self._auto = False
+            self.notify("auto_inhibiting")
+        if self._is_inhibiting:
+            self._is_inhibiting = False
+            self.notify("is_inhibiting")
+
+    def __release(self) -> None:
+        if self._inhibit_cookie:
+            app = Gio.Application.get_default()
+            if isinstance(app, Gtk.Application):
+                app.uninhibit(self._inhibit_cookie)
+            self._inhibit_cookie = 0
+
+        if self._inhibit_fd is not None:
+            os.close(self._inhibit_fd)
+            self._inhibit_fd = None
+
+        if self._inhibit_process is not None:
+            # Reaped asynchronously by __on_wlinhibit_exited
+            self._inhibit_process.send_signal(SIGTERM)
+            self._inhibit_process = None
+
     def cleanup(self):
         """Clean up resources"""
-        if self._is_inhibiting and self._inhibit_process:
-            try:
-                self._inhibit_process.terminate()
-                self._inhibit_process.wait(timeout=2)
-            except Exception:
-                try:
-                    self._inhibit_process.kill()
-                except Exception:
-                    pass
-            finally:
-                self._inhibit_process = None
-                self._is_inhibiting = False
+        self._is_inhibiting = False
+        self.__release()
 
     @property
     def inhibit_method(self) -> str | None:
-        """Get the current inhibition method being used"""
-        return self._inhibit_method
+        """Get the current idle inhibition method being used"""
+        if self._inhibit_cookie:
+            return "gtk"
+        if self._inhibit_process is not None:
+            return "wlinhibit"
+        if self._inhibit_fd is not None:
+            return "logind"
+        if isinstance(Gio.Application.get_default(), Gtk.Application):
+            return "gtk"
+        if self._wlinhibit and not self._wlinhibit_failed:
+            return "wlinhibit"
+        if self._logind:
+            return "logind"
+        return None
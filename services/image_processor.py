@@ -62,40 +62,6 @@ def scale_to_fit(
         return image_path
 
 
-def crop_to_square(image_path: str) -> str:
-    """
-    Crop an image to square aspect ratio (center crop).
-    Returns path to cropped image, or original path if cropping fails/not needed.
-    """
-    if not image_path or not os.path.exists(image_path):
-        return image_path
-
-    try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-
-            if width == height:
-                return image_path
-
-            size = min(width, height)
-            left = (width - size) // 2
-            top = (height - size) // 2
-            right = left + size
-            bottom = top + size
-
-            cropped = img.crop((left, top, right, bottom))
-
-            temp_fd, temp_path = tempfile.mkstemp(suffix=".png")
-            os.close(temp_fd)
-            cropped.save(temp_path, "PNG")
-
-            return temp_path
-
-    except Exception as e:
-        print(f"Error cropping image {image_path}: {e}")
-        return image_path
-
-
 def scale_to_screen_resolution(image_path: str) -> str:
     """
     Scale an image to fit screen resolution while preserving aspect ratio.
@@ -8,4 +8,19 @@ MATERIAL_CACHE_DIR = f"{ignis.CACHE_DIR}/material"  # type: ignore
 TEMPLATES = utils.get_current_dir() + "/templates"
 SAMPLE_WALL = utils.get_current_dir() + "/sample_wall.png"
 
+HYPRLAND_CONF = os.path.expanduser("~/.config/hypr/hyprland.conf")
+HYPRLAND_BLUR_CONF = os.path.join(
+    utils.get_current_dir(), "../../assets/hypr/blur.conf"
+)
+
+# Hyprland options set from the generated colors at runtime
+HYPRLAND_COLOR_KEYWORDS = {
+    "general:col.active_border": "primary",
+    "general:col.inactive_border": "surface",
+}
+
+# hyprctl reload only applies the config on Hyprland's next tick, so runtime
+# layer rules are re-added after this long
+HYPRLAND_RELOAD_DELAY = 500  # ms
+
 os.makedirs(MATERIAL_CACHE_DIR, exist_ok=True)
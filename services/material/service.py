@@ -5,6 +5,7 @@ from ignis import utils
 from ignis.base_service import BaseService
 from ignis.css_manager import CssManager
 from ignis.options import options
+from ignis.services.hyprland import HyprlandService
 from jinja2 import Template
 from materialyoucolor.dynamiccolor.material_dynamic_colors import MaterialDynamicColors
 from materialyoucolor.hct import Hct
@@ -22,10 +23,19 @@ from materialyoucolor.score.score import Score
 from PIL import Image
 from user_options import user_options
 
-from .constants import MATERIAL_CACHE_DIR, SAMPLE_WALL, TEMPLATES
-from .util import calculate_optimal_size, rgba_to_hex
+from .constants import (
+    HYPRLAND_BLUR_CONF,
+    HYPRLAND_COLOR_KEYWORDS,
+    HYPRLAND_CONF,
+    HYPRLAND_RELOAD_DELAY,
+    MATERIAL_CACHE_DIR,
+    SAMPLE_WALL,
+    TEMPLATES,
+)
+from .util import calculate_optimal_size, parse_layer_rules, rgba_to_hex
 
 css_manager = CssManager.get_default()
+hyprland = HyprlandService.get_default()
 
 # Color scheme mappings
 COLOR_SCHEMES = {
@@ -66,6 +76,15 @@ class MaterialService(BaseService):
         user_options.material.connect_option(
             "blur_enabled", lambda: self.__handle_blur_change()
         )
+        user_options.material.connect_option(
+            "persist_hyprland_config", lambda: self.__update_hyprland_blur_config()
+        )
+        user_options.material.connect_option(
+            "theme_hyprland", lambda: self.__on_theme_hyprland_changed()
+        )
+
+        # hyprland.conf may not source blur.conf, so apply the saved state now
+        self.__apply_hyprland_blur()
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics for monitoring performance"""
@@ -90,25 +109,75 @@ class MaterialService(BaseService):
 
             user_options.material.colors = colors
             css_manager.reload_all_css()
+            self.__apply_hyprland_colors(colors)
             asyncio.create_task(self.__set_matugen_scheme())
         else:
             print("Ignoring option change:", option_name)
 
     def __handle_blur_change(self):
         css_manager.reload_all_css()
+        self.__apply_hyprland_blur()
         self.__update_hyprland_blur_config()
 
+    def __send_hyprland_batch(self, commands: list[str]) -> None:
+        """Run hyprctl commands through the Hyprland socket in one request"""
+        if not hyprland.is_available or not commands:
+            return
+        try:
+            hyprland.send_command("[[BATCH]]" + ";".join(commands))
+        except Exception as e:
+            print(f"Error sending Hyprland commands: {e}")
+
+    def __on_theme_hyprland_changed(self) -> None:
+        if user_options.material.theme_hyprland:
+            self.__apply_hyprland_colors(user_options.material.colors)
+            return
+
+        # Reloading restores the borders from hyprland.conf, but also drops
+        # the blur layer rules added at runtime
+        self.__send_hyprland_batch(["reload"])
+        utils.Timeout(HYPRLAND_RELOAD_DELAY, self.__apply_hyprland_blur)
+
+    def __apply_hyprland_blur(self) -> None:
+        """Add or remove the blur.conf layer rules on the running compositor"""
+        try:
+            rules = parse_layer_rules(HYPRLAND_BLUR_CONF)
+        except OSError:
+            return
+
+        # unset drops every rule added for exactly that namespace regex, so
+        # re-enabling (or a config that already sources blur.conf) does not
+        # stack duplicates
+        namespaces = dict.fromkeys(ns for _, ns in rules)
+        commands = [f"keyword layerrule unset, {ns}" for ns in namespaces]
+        if user_options.material.blur_enabled:
+            commands += [f"keyword layerrule {rule}, {ns}" for rule, ns in rules]
+        self.__send_hyprland_batch(commands)
+
+    def __apply_hyprland_colors(self, colors: dict[str, str]) -> None:
+        """Set the ``HYPRLAND_COLOR_KEYWORDS`` options, with ``theme_hyprland``"""
+        if not user_options.material.theme_hyprland:
+            return
+        commands = [
+            f"keyword {keyword} rgb({colors[name].lstrip('#')})"
+            for keyword, name in HYPRLAND_COLOR_KEYWORDS.items()
+            if name in colors
+        ]
+        self.__send_hyprland_batch(commands)
+
     def __update_hyprland_blur_config(self):
-        """Add or remove blur.conf source line from hyprland.conf"""
-        hyprland_conf_path = os.path.expanduser("~/.config/hypr/hyprland.conf")
-        blur_conf_path = os.path.join(
-            utils.get_current_dir(), "../../assets/hypr/blur.conf"
-        )
-        source_line = f"source={blur_conf_path}"
-        if not os.path.exists(hyprland_conf_path):
+        """
+        Add or remove blur.conf source line from hyprland.conf. Only done when
+        ``persist_hyprland_config`` is set; otherwise the line is left as is.
+        """
+        if not user_options.material.persist_hyprland_config:
+            return
+
+        source_line = f"source={HYPRLAND_BLUR_CONF}"
+        if not os.path.exists(HYPRLAND_CONF):
             return
         try:
-            with open(hyprland_conf_path, "r") as f:
+            with open(HYPRLAND_CONF, "r") as f:
                 lines = f.readlines()
         except Exception:
             return
@@ -121,7 +190,7 @@ class MaterialService(BaseService):
             lines.append(f"{source_line}\n")
 
         try:
-            with open(hyprland_conf_path, "w") as f:
+            with open(HYPRLAND_CONF, "w") as f:
                 f.writelines(lines)
         except Exception:
             pass
@@ -129,7 +198,6 @@ class MaterialService(BaseService):
     def __on_colors_not_found(self) -> None:
         options.wallpaper.set_wallpaper_path(SAMPLE_WALL)
         self.generate_colors(SAMPLE_WALL)
-        asyncio.create_task(utils.exec_sh_async("hyprctl reload"))
 
     def get_colors_from_img(self, path: str, dark_mode: bool) -> dict[str, str]:
         """Get colors from image with caching for performance"""
@@ -194,6 +262,7 @@ class MaterialService(BaseService):
         dark_colors = self.get_colors_from_img(path, True)
         user_options.material.colors = colors
         self.__render_templates(colors, dark_colors)
+        self.__apply_hyprland_colors(colors)
         asyncio.create_task(self.__setup(path))
 
     def __render_templates(self, colors: dict, dark_colors: dict) -> None:
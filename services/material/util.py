@@ -16,3 +16,17 @@ def calculate_optimal_size(width: int, height: int, bitmap_size: int) -> tuple:
     if new_height == 0:
         new_height = 1
     return new_width, new_height
+
+
+def parse_layer_rules(path: str) -> list[tuple[str, str]]:
+    """Read ``layerrule = <rule>, <namespace>`` lines from a Hyprland config"""
+    rules = []
+    with open(path) as file:
+        for line in file:
+            key, sep, value = line.strip().partition("=")
+            if not sep or key.strip() != "layerrule":
+                continue
+            rule, sep, namespace = value.rpartition(",")
+            if sep:
+                rules.append((rule.strip(), namespace.strip()))
+    return rules
@@ -0,0 +1,34 @@
+from ignis import utils
+from ignis.services.hyprland import HyprlandService
+from ignis.services.niri import NiriService
+
+hyprland = HyprlandService.get_default()
+niri = NiriService.get_default()
+
+
+def get_monitor_connector(monitor_id: int) -> str | None:
+    """Return the connector name (e.g. ``DP-1``) of a GDK monitor index"""
+    monitor = utils.get_monitor(monitor_id)
+    return monitor.get_connector() if monitor else None
+
+
+def get_monitor_id(connector: str | None) -> int | None:
+    """Return the GDK monitor index for a connector name"""
+    if not connector:
+        return None
+    for monitor_id in range(utils.get_n_monitors()):
+        if get_monitor_connector(monitor_id) == connector:
+            return monitor_id
+    return None
+
+
+def get_focused_monitor_id() -> int:
+    """Return the GDK monitor index of the focused output, or 0 if unknown"""
+    connector = None
+    if hyprland.is_available and hyprland.active_workspace:
+        connector = hyprland.active_workspace.monitor
+    elif niri.is_available:
+        connector = niri.active_output
+
+    monitor_id = get_monitor_id(connector)
+    return monitor_id if monitor_id is not None else 0
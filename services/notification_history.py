@@ -0,0 +1,216 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Callable, NamedTuple
+
+from ignis import DATA_DIR, utils  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.notifications import Notification, NotificationService
+
+HISTORY_DB = os.path.join(DATA_DIR, "notification_history.db")  # type: ignore
+
+RETENTION_DAYS = 60
+# Retention is also enforced every this many inserts, not only at startup
+PRUNE_EVERY = 500
+
+PAGE_SIZE = 30
+
+# Most rows the writer thread inserts in one transaction
+WRITE_BATCH = 100
+
+# Queued in place of a row to make the writer thread prune old entries
+_PRUNE = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    app_name TEXT NOT NULL,
+    app_icon TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notifications_time ON notifications (time);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notifications_fts USING fts5(
+    summary, body, app_name, content='notifications', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS notifications_ai AFTER INSERT ON notifications BEGIN
+    INSERT INTO notifications_fts (rowid, summary, body, app_name)
+    VALUES (new.id, new.summary, new.body, new.app_name);
+END;
+CREATE TRIGGER IF NOT EXISTS notifications_ad AFTER DELETE ON notifications BEGIN
+    INSERT INTO notifications_fts (notifications_fts, rowid, summary, body, app_name)
+    VALUES ('delete', old.id, old.summary, old.body, old.app_name);
+END;
+"""
+
+
+class HistoryEntry(NamedTuple):
+    id: int
+    time: float
+    app_name: str
+    app_icon: str
+    summary: str
+    body: str
+
+
+def _connect() -> sqlite3.Connection:
+    connection = sqlite3.connect(HISTORY_DB, timeout=5)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def _like_pattern(text: str) -> str:
+    """Turn free text into a LIKE pattern matching it literally as a substring"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix"""
+    words = text.replace('"', " ").split()
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class NotificationHistoryService(BaseService):
+    """
+    Persistent notification history in SQLite.
+
+    Every notification is recorded when it arrives. Searches use an FTS5
+    index on summary, body and app name (``LIKE`` if FTS5 is unavailable).
+    Inserts and pruning are queued to a single writer thread that owns one
+    connection and inserts in batches; searches run in worker threads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        os.makedirs(os.path.dirname(HISTORY_DB), exist_ok=True)
+
+        with closing(_connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+            try:
+                connection.executescript(FTS_SCHEMA)
+                self._has_fts = True
+            except sqlite3.OperationalError:
+                self._has_fts = False
+
+        self._inserts = 0
+        self._queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._writer, daemon=True).start()
+        self.prune()
+
+        NotificationService.get_default().connect(
+            "notified", lambda x, notification: self.record(notification)
+        )
+
+    def record(self, notification: Notification) -> None:
+        """Queue ``notification`` for the writer thread"""
+        row = (
+            notification.time or time.time(),
+            notification.app_name or "",
+            notification.app_icon or "",
+            notification.summary or "",
+            notification.body or "",
+        )
+        self._queue.put(row)
+
+        self._inserts += 1
+        if self._inserts % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """Queue removal of entries older than ``RETENTION_DAYS``"""
+        self._queue.put(_PRUNE)
+
+    def _writer(self) -> None:
+        connection = _connect()
+        while True:
+            items = [self._queue.get()]
+            while len(items) < WRITE_BATCH:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [item for item in items if item is not _PRUNE]
+            if rows:
+                self._record(connection, rows)
+            if len(rows) < len(items):
+                self._prune(connection)
+
+    def _record(self, connection: sqlite3.Connection, rows: list[tuple]) -> None:
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO notifications (time, app_name, app_icon, summary, body)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            print(f"Error recording notification history: {e}")
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        cutoff = time.time() - RETENTION_DAYS * 86400
+        try:
+            with connection:
+                connection.execute(
+                    "DELETE FROM notifications WHERE time < ?", (cutoff,)
+                )
+        except sqlite3.Error as e:
+            print(f"Error pruning notification history: {e}")
+
+    def search(
+        self,
+        text: str,
+        callback: Callable[[list[HistoryEntry]], None],
+        offset: int = 0,
+        limit: int = PAGE_SIZE,
+    ) -> None:
+        """
+        Call ``callback`` on the main loop with one page of entries matching
+        ``text``, newest first. An empty ``text`` matches everything.
+        """
+        utils.ThreadTask(
+            lambda: self._search(text, offset, limit),
+            callback,
+        ).run()
+
+    def _search(self, text: str, offset: int, limit: int) -> list[HistoryEntry]:
+        columns = "n.id, n.time, n.app_name, n.app_icon, n.summary, n.body"
+        query = _fts_query(text)
+
+        if not query:
+            sql = f"SELECT {columns} FROM notifications n"
+            params: tuple = ()
+        elif self._has_fts:
+            sql = (
+                f"SELECT {columns} FROM notifications_fts f"
+                " JOIN notifications n ON n.id = f.rowid"
+                " WHERE notifications_fts MATCH ?"
+            )
+            params = (query,)
+        else:
+            pattern = _like_pattern(text.strip())
+            sql = (
+                f"SELECT {columns} FROM notifications n"
+                " WHERE n.summary LIKE ? ESCAPE '\\' OR n.body LIKE ? ESCAPE '\\'"
+                " OR n.app_name LIKE ? ESCAPE '\\'"
+            )
+            params = (pattern, pattern, pattern)
+
+        sql += " ORDER BY n.time DESC, n.id DESC LIMIT ? OFFSET ?"
+        try:
+            with closing(_connect()) as connection:
+                rows = connection.execute(sql, (*params, limit, offset)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching notification history: {e}")
+            return []
+
+        return [HistoryEntry(*row) for row in rows]
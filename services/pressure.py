@@ -0,0 +1,180 @@
+import os
+
+from gi.repository import GLib, GObject
+from ignis import utils
+from ignis.base_service import BaseService
+
+PSI_DIR = "/proc/pressure"
+
+# "some <stall us> <window us>": wake up when tasks were stalled for longer
+# than the threshold within the window. Unprivileged users may only register
+# windows that are a multiple of 2 s.
+PSI_TRIGGERS = {
+    "memory": "some 150000 2000000",
+    "cpu": "some 500000 2000000",
+    "io": "some 500000 2000000",
+}
+
+# Only memory pressure has a consumer (the RAM indicator); cpu and io triggers
+# are registered on demand through PressureService.watch(), since every
+# trigger costs wakeups and recovery checks.
+DEFAULT_RESOURCES = ("memory",)
+
+# While stalled, avg10 is re-checked at this interval until it drops below
+# RELEASE_AVG10 (percent); there is no polling while the system is healthy.
+RECOVERY_CHECK_INTERVAL = 5000  # ms
+RELEASE_AVG10 = 5.0
+
+
+class PsiTrigger:
+    """A registered PSI trigger on one ``/proc/pressure`` file"""
+
+    def __init__(self, resource: str, on_trigger):
+        self.resource = resource
+        self._on_trigger = on_trigger
+        self._fd = os.open(
+            os.path.join(PSI_DIR, resource),
+            os.O_RDWR | os.O_NONBLOCK | os.O_CLOEXEC,
+        )
+        try:
+            os.write(self._fd, PSI_TRIGGERS[resource].encode() + b"\0")
+        except OSError:
+            os.close(self._fd)
+            raise
+
+        self._watch_id = GLib.io_add_watch(
+            self._fd,
+            GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.PRI | GLib.IOCondition.ERR,
+            self.__on_io,
+        )
+
+    def __on_io(self, fd: int, condition: GLib.IOCondition) -> bool:
+        if condition & GLib.IOCondition.ERR:
+            # The monitored cgroup/file went away
+            self._watch_id = 0
+            return False
+        self._on_trigger(self)
+        return True
+
+    def read_avg10(self) -> float:
+        """Return the "some avg10" stall percentage"""
+        try:
+            data = os.pread(self._fd, 256, 0)
+        except OSError:
+            return 0.0
+        for field in data.split(b"\n", 1)[0].split():
+            if field.startswith(b"avg10="):
+                return float(field[6:])
+        return 0.0
+
+    def close(self) -> None:
+        if self._watch_id:
+            GLib.source_remove(self._watch_id)
+            self._watch_id = 0
+        os.close(self._fd)
+
+
+class PressureService(BaseService):
+    """
+    Kernel-driven memory/CPU/IO pressure monitoring using PSI triggers.
+
+    The main loop only wakes up when a stall threshold is crossed. A resource
+    stays ``*_stalled`` until its 10 s average drops below ``RELEASE_AVG10``.
+    Only memory is monitored by default; call ``watch()`` before relying on
+    the cpu or io properties.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._triggers: dict[str, PsiTrigger] = {}
+        self._stalled = {resource: False for resource in PSI_TRIGGERS}
+        self._avg10 = {resource: 0.0 for resource in PSI_TRIGGERS}
+        self._recovery_checks: dict[str, utils.Timeout] = {}
+
+        for resource in DEFAULT_RESOURCES:
+            self.watch(resource)
+
+    def watch(self, resource: str) -> bool:
+        """
+        Register the PSI trigger for ``resource`` ("memory", "cpu" or "io")
+        if it is not registered yet.
+
+        Returns:
+            bool: Whether the trigger is registered
+        """
+        if resource not in self._triggers:
+            try:
+                self._triggers[resource] = PsiTrigger(resource, self.__on_trigger)
+            except OSError:
+                # PSI disabled, kernel too old, or triggers not permitted
+                return False
+        return True
+
+    @GObject.Property(type=bool, default=False)
+    def available(self) -> bool:
+        """Whether memory pressure triggers could be registered"""
+        return "memory" in self._triggers
+
+    @GObject.Property(type=bool, default=False)
+    def memory_stalled(self) -> bool:
+        """Whether tasks are currently stalled waiting for memory"""
+        return self._stalled["memory"]
+
+    @GObject.Property(type=bool, default=False)
+    def cpu_stalled(self) -> bool:
+        """Whether tasks are currently stalled waiting for CPU"""
+        return self._stalled["cpu"]
+
+    @GObject.Property(type=bool, default=False)
+    def io_stalled(self) -> bool:
+        """Whether tasks are currently stalled waiting for IO"""
+        return self._stalled["io"]
+
+    @GObject.Property(type=float, default=0.0)
+    def memory_pressure(self) -> float:
+        """Last observed memory "some avg10", in percent"""
+        return self._avg10["memory"]
+
+    @GObject.Property(type=float, default=0.0)
+    def cpu_pressure(self) -> float:
+        """Last observed CPU "some avg10", in percent"""
+        return self._avg10["cpu"]
+
+    @GObject.Property(type=float, default=0.0)
+    def io_pressure(self) -> float:
+        """Last observed IO "some avg10", in percent"""
+        return self._avg10["io"]
+
+    def __on_trigger(self, trigger: PsiTrigger) -> None:
+        resource = trigger.resource
+        self.__update_avg10(trigger)
+
+        if not self._stalled[resource]:
+            self._stalled[resource] = True
+            self.notify(f"{resource}-stalled")
+
+        if resource not in self._recovery_checks:
+            self.__schedule_recovery_check(resource)
+
+    def __schedule_recovery_check(self, resource: str) -> None:
+        self._recovery_checks[resource] = utils.Timeout(
+            RECOVERY_CHECK_INTERVAL, self.__check_recovery, resource
+        )
+
+    def __check_recovery(self, resource: str) -> None:
+        del self._recovery_checks[resource]
+        self.__update_avg10(self._triggers[resource])
+
+        if self._avg10[resource] >= RELEASE_AVG10:
+            self.__schedule_recovery_check(resource)
+            return
+
+        self._stalled[resource] = False
+        self.notify(f"{resource}-stalled")
+
+    def __update_avg10(self, trigger: PsiTrigger) -> None:
+        avg10 = trigger.read_avg10()
+        if avg10 != self._avg10[trigger.resource]:
+            self._avg10[trigger.resource] = avg10
+            self.notify(f"{trigger.resource}-pressure")
@@ -0,0 +1,196 @@
+import os
+import socket
+import struct
+
+from gi.repository import GLib, GObject
+from ignis import utils
+from ignis.base_service import BaseService
+
+# Screen recorders whose processes mark the session as being recorded
+RECORDING_PROCESSES = [
+    "wf-recorder",
+    "wl-screenrec",
+    "gpu-screen-recorder",
+    "obs",
+    "ffmpeg",
+    "grim",
+]
+
+# Fallback /proc rescan interval when the proc connector is not permitted
+SCAN_INTERVAL = 2000  # ms
+
+# A new PID's comm is re-read on this many later scans, to catch processes
+# that exec into a recorder right after being spawned (``sh -c "exec ..."``)
+NEW_PID_RECHECKS = 2
+
+# The kernel truncates comm to TASK_COMM_LEN - 1 characters
+COMM_LEN = 15
+
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_COMM = 0x00000200
+PROC_EVENT_EXIT = 0x80000000
+
+NLMSGHDR = struct.Struct("=IHHII")
+CN_MSG = struct.Struct("=IIIIHH")
+PROC_EVENT_HEADER = struct.Struct("=IIQ")
+PROC_EVENT_PIDS = struct.Struct("=ii")
+EVENT_OFFSET = NLMSGHDR.size + CN_MSG.size
+EVENT_DATA_OFFSET = EVENT_OFFSET + PROC_EVENT_HEADER.size
+
+
+def _read_comm(pid: int) -> str | None:
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            return f.read().rstrip(b"\n").decode(errors="replace")
+    except OSError:
+        return None
+
+
+def _open_proc_connector() -> socket.socket | None:
+    """Subscribe to kernel process events; needs CAP_NET_ADMIN"""
+    try:
+        sock = socket.socket(
+            socket.AF_NETLINK,
+            socket.SOCK_DGRAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC,
+            NETLINK_CONNECTOR,
+        )
+    except OSError:
+        return None
+
+    try:
+        sock.bind((0, CN_IDX_PROC))
+        op = struct.pack("=I", PROC_CN_MCAST_LISTEN)
+        cn_msg = CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0)
+        length = NLMSGHDR.size + len(cn_msg) + len(op)
+        sock.send(NLMSGHDR.pack(length, NLMSG_DONE, 0, 0, 0) + cn_msg + op)
+    except OSError:
+        sock.close()
+        return None
+
+    return sock
+
+
+class ProcessWatcherService(BaseService):
+    """
+    Tracks running screen-recorder processes.
+
+    Uses the netlink proc connector to react to exec/exit events when
+    permitted. Otherwise it periodically lists ``/proc`` and diffs it by PID:
+    ``comm`` is only read for new PIDs, and for ``NEW_PID_RECHECKS`` more
+    scans after that while they have not matched.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._names = {name[:COMM_LEN] for name in RECORDING_PROCESSES}
+        # pid -> matched name, or None for PIDs that do not match
+        self._pids: dict[int, str | None] = {}
+        # Unmatched new pid -> remaining comm re-reads
+        self._rechecks: dict[int, int] = {}
+        self._running: dict[int, str] = {}
+
+        self._scan_proc()
+
+        self._sock = _open_proc_connector()
+        if self._sock:
+            GLib.io_add_watch(
+                self._sock.fileno(),
+                GLib.PRIORITY_DEFAULT,
+                GLib.IOCondition.IN,
+                self.__on_proc_event,
+            )
+            # Exit events keep _running accurate, the PID table is not needed
+            self._pids.clear()
+            self._rechecks.clear()
+        else:
+            self._poll = utils.Poll(SCAN_INTERVAL, lambda _: self._scan_proc())
+
+    @GObject.Property
+    def running(self) -> list[str]:
+        """Names of the watched processes that are currently running"""
+        return sorted(set(self._running.values()))
+
+    @GObject.Property(type=bool, default=False)
+    def is_event_driven(self) -> bool:
+        """Whether process events come from the kernel instead of /proc rescans"""
+        return self._sock is not None
+
+    def _match(self, pid: int) -> str | None:
+        comm = _read_comm(pid)
+        return comm if comm in self._names else None
+
+    def _set_running(self, pid: int, name: str | None) -> None:
+        before = self._running.get(pid)
+
+        if name:
+            self._running[pid] = name
+        else:
+            self._running.pop(pid, None)
+
+        if before != name:
+            self.notify("running")
+
+    def _scan_proc(self) -> None:
+        pids = {int(entry) for entry in os.listdir("/proc") if entry.isdigit()}
+
+        for pid in self._pids.keys() - pids:
+            self._rechecks.pop(pid, None)
+            if self._pids.pop(pid):
+                self._set_running(pid, None)
+
+        for pid, remaining in list(self._rechecks.items()):
+            name = self._match(pid)
+            if name or remaining <= 1:
+                del self._rechecks[pid]
+            else:
+                self._rechecks[pid] = remaining - 1
+            if name:
+                self._pids[pid] = name
+                self._set_running(pid, name)
+
+        for pid in pids - self._pids.keys():
+            name = self._match(pid)
+            self._pids[pid] = name
+            if name:
+                self._set_running(pid, name)
+            else:
+                self._rechecks[pid] = NEW_PID_RECHECKS
+
+    def __on_proc_event(self, fd: int, condition: GLib.IOCondition) -> bool:
+        while True:
+            try:
+                data = self._sock.recv(4096)  # type: ignore
+            except BlockingIOError:
+                return True
+            except OSError:
+                # e.g. ENOBUFS after an event burst; resync from /proc
+                self._resync()
+                continue
+
+            if len(data) < EVENT_DATA_OFFSET + PROC_EVENT_PIDS.size:
+                continue
+
+            what = PROC_EVENT_HEADER.unpack_from(data, EVENT_OFFSET)[0]
+            pid, tgid = PROC_EVENT_PIDS.unpack_from(data, EVENT_DATA_OFFSET)
+            if pid != tgid:
+                continue
+
+            if what in (PROC_EVENT_EXEC, PROC_EVENT_COMM):
+                self._set_running(tgid, self._match(tgid))
+            elif what == PROC_EVENT_EXIT and tgid in self._running:
+                self._set_running(tgid, None)
+
+    def _resync(self) -> None:
+        running = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit() and (name := self._match(int(entry))):
+                running[int(entry)] = name
+
+        if running != self._running:
+            self._running = running
+            self.notify("running")
@@ -0,0 +1,47 @@
+from gi.repository import Gio, GLib, GObject
+from ignis.base_service import BaseService
+
+
+class SleepMonitorService(BaseService):
+    """
+    Emits signals around system suspend using logind's ``PrepareForSleep``.
+
+    Monotonic GLib timers do not advance while the system is suspended, so
+    anything aligned to wall-clock time or refreshed on an interval should
+    reschedule itself on ``resumed``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._bus: Gio.DBusConnection | None = None
+        Gio.bus_get(Gio.BusType.SYSTEM, None, self.__on_bus_acquired)
+
+    @GObject.Signal
+    def suspending(self):
+        """Emitted right before the system goes to sleep"""
+
+    @GObject.Signal
+    def resumed(self):
+        """Emitted after the system wakes up"""
+
+    def __on_bus_acquired(self, source, result: Gio.AsyncResult) -> None:
+        try:
+            self._bus = Gio.bus_get_finish(result)
+        except GLib.Error:
+            return
+
+        self._bus.signal_subscribe(
+            "org.freedesktop.login1",
+            "org.freedesktop.login1.Manager",
+            "PrepareForSleep",
+            "/org/freedesktop/login1",
+            None,
+            Gio.DBusSignalFlags.NONE,
+            self.__on_prepare_for_sleep,
+        )
+
+    def __on_prepare_for_sleep(
+        self, connection, sender, path, interface, signal, parameters: GLib.Variant
+    ) -> None:
+        (going_to_sleep,) = parameters.unpack()
+        self.emit("suspending" if going_to_sleep else "resumed")
@@ -0,0 +1,42 @@
+import os
+import time
+from contextlib import contextmanager
+
+# Set FLUX_STARTUP_REPORT=1 to print how long each component took to build
+ENABLED = bool(os.getenv("FLUX_STARTUP_REPORT"))
+
+_started = time.perf_counter()
+_timings: list[tuple[str, float]] = []
+
+
+@contextmanager
+def measure(name: str):
+    """Record how long the ``with`` block takes under ``name``"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings.append((name, time.perf_counter() - start))
+
+
+def print_report() -> None:
+    """Print the startup timings, slowest first"""
+    if not ENABLED:
+        return
+
+    total = time.perf_counter() - _started
+    print(f"Startup report ({total * 1000:.1f} ms since config import):")
+    for name, seconds in sorted(_timings, key=lambda t: t[1], reverse=True):
+        print(f"  {seconds * 1000:8.1f} ms  {name}")
+
+
+@contextmanager
+def measure_deferred(name: str):
+    """Print how long work that was moved out of startup took, once it runs"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if ENABLED:
+            elapsed = time.perf_counter() - start
+            print(f"Deferred build: {elapsed * 1000:.1f} ms  {name}")
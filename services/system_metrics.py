@@ -0,0 +1,227 @@
+import glob
+import os
+from array import array
+
+from gi.repository import GObject
+from ignis import utils
+from ignis.base_service import BaseService
+
+SAMPLE_INTERVAL = 2000  # ms
+HISTORY_SECONDS = 180
+HISTORY_SIZE = HISTORY_SECONDS * 1000 // SAMPLE_INTERVAL
+
+PROC_STAT = "/proc/stat"
+PROC_MEMINFO = "/proc/meminfo"
+
+# hwmon drivers that report the CPU package temperature, in order of preference
+CPU_HWMON_NAMES = ("coretemp", "k10temp", "zenpower", "cpu_thermal")
+
+
+def _open_readonly(path: str) -> int | None:
+    try:
+        return os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+
+
+def _find_cpu_temp_path() -> str | None:
+    """Find the sysfs file exposing the CPU temperature"""
+    for name_file in sorted(glob.glob("/sys/class/hwmon/hwmon*/name")):
+        try:
+            with open(name_file) as f:
+                name = f.read().strip()
+        except OSError:
+            continue
+        if name in CPU_HWMON_NAMES:
+            temp_input = os.path.join(os.path.dirname(name_file), "temp1_input")
+            if os.path.exists(temp_input):
+                return temp_input
+
+    fallback = "/sys/class/thermal/thermal_zone0/temp"
+    return fallback if os.path.exists(fallback) else None
+
+
+class RingBuffer:
+    """Fixed-size float history backed by a preallocated ``array``"""
+
+    def __init__(self, size: int):
+        self._data = array("d", bytes(8 * size))
+        self._size = size
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def push(self, value: float) -> None:
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def last(self) -> float:
+        if self._count == 0:
+            return 0.0
+        return self._data[self._head - 1]
+
+    def __iter__(self):
+        """Iterate from the oldest to the newest sample"""
+        start = (self._head - self._count) % self._size
+        for i in range(self._count):
+            yield self._data[(start + i) % self._size]
+
+
+class SystemMetricsService(BaseService):
+    """
+    Samples CPU, memory and temperature once per interval for the whole shell.
+
+    The proc/sysfs files are opened once and re-read with ``os.pread``, so a
+    sample costs one syscall per file no matter how many bars display it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._stat_fd = _open_readonly(PROC_STAT)
+        self._meminfo_fd = _open_readonly(PROC_MEMINFO)
+        temp_path = _find_cpu_temp_path()
+        self._temp_fd = _open_readonly(temp_path) if temp_path else None
+
+        # The cpu lines come first; the read only needs to cover them
+        self._stat_size = max(8192, 160 * ((os.cpu_count() or 1) + 1))
+
+        # Index 0 is the aggregate "cpu" line, 1.. are cpu0, cpu1, ...
+        n_lines = self._count_cpu_lines()
+        self._prev_idle = array("Q", bytes(8 * n_lines))
+        self._prev_total = array("Q", bytes(8 * n_lines))
+        self._history = [RingBuffer(HISTORY_SIZE) for _ in range(n_lines)]
+
+        self._cpu_percent = 0.0
+        self._cpu_temp = 0.0
+        self._mem_total = 0
+        self._mem_used = 0
+
+        self._sample()
+        self._poll = utils.Poll(SAMPLE_INTERVAL, lambda _: self._sample())
+
+    @GObject.Property(type=float, default=0.0)
+    def cpu_percent(self) -> float:
+        """Aggregate CPU utilization, in percent"""
+        return self._cpu_percent
+
+    @GObject.Property(type=int, default=0)
+    def core_count(self) -> int:
+        """Number of CPU cores listed in /proc/stat"""
+        return len(self._history) - 1
+
+    @GObject.Signal
+    def sampled(self):
+        """Emitted after every sample, once the history buffers are updated"""
+
+    @property
+    def cpu_history(self) -> RingBuffer:
+        """Aggregate CPU utilization history, in percent"""
+        return self._history[0]
+
+    @property
+    def core_history(self) -> list[RingBuffer]:
+        """Per-core CPU utilization history, in percent"""
+        return self._history[1:]
+
+    @GObject.Property(type=float, default=0.0)
+    def cpu_temp(self) -> float:
+        """CPU temperature, in °C"""
+        return self._cpu_temp
+
+    @GObject.Property(type=GObject.TYPE_INT64, default=0)
+    def mem_total(self) -> int:
+        """Total memory, in KiB"""
+        return self._mem_total
+
+    @GObject.Property(type=GObject.TYPE_INT64, default=0)
+    def mem_used(self) -> int:
+        """Used memory (total - available), in KiB"""
+        return self._mem_used
+
+    @GObject.Property(type=float, default=0.0)
+    def mem_percent(self) -> float:
+        """Used memory, in percent"""
+        if self._mem_total == 0:
+            return 0.0
+        return self._mem_used / self._mem_total * 100
+
+    def _read(self, fd: int | None, size: int = 8192) -> bytes:
+        if fd is None:
+            return b""
+        try:
+            return os.pread(fd, size, 0)
+        except OSError:
+            return b""
+
+    def _set(self, name: str, value) -> None:
+        if getattr(self, f"_{name}") != value:
+            setattr(self, f"_{name}", value)
+            self.notify(name.replace("_", "-"))
+
+    def _sample(self) -> None:
+        self._sample_cpu()
+        self._sample_memory()
+        self._sample_temp()
+        self.emit("sampled")
+
+    def _count_cpu_lines(self) -> int:
+        data = self._read(self._stat_fd, self._stat_size)
+        return max(1, sum(1 for line in data.splitlines() if line.startswith(b"cpu")))
+
+    def _sample_cpu(self) -> None:
+        data = self._read(self._stat_fd, self._stat_size)
+        if not data:
+            return
+
+        n_lines = len(self._history)
+        for i, line in enumerate(data.splitlines()):
+            if i >= n_lines or not line.startswith(b"cpu"):
+                break
+
+            cpu_times = [int(x) for x in line.split()[1:]]
+            idle_time = cpu_times[3]
+            total_time = sum(cpu_times)
+
+            if self._prev_total[i] != 0:
+                total_diff = total_time - self._prev_total[i]
+                percent = 0.0
+                if total_diff > 0:
+                    percent = (1 - (idle_time - self._prev_idle[i]) / total_diff) * 100
+                self._history[i].push(percent)
+
+            self._prev_idle[i] = idle_time
+            self._prev_total[i] = total_time
+
+        self._set("cpu_percent", round(self._history[0].last(), 1))
+
+    def _sample_memory(self) -> None:
+        data = self._read(self._meminfo_fd)
+        if not data:
+            return
+
+        total = available = 0
+        for line in data.splitlines():
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1])
+                break
+
+        changed = total != self._mem_total or total - available != self._mem_used
+        self._set("mem_total", total)
+        self._set("mem_used", total - available)
+        if changed:
+            self.notify("mem-percent")
+
+    def _sample_temp(self) -> None:
+        data = self._read(self._temp_fd, 32)
+        if data:
+            self._set("cpu_temp", round(int(data) / 1000, 1))
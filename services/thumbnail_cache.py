@@ -0,0 +1,277 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from gi.repository import Gdk, GdkPixbuf
+from ignis import CACHE_DIR, utils  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.notifications import Notification
+from PIL import Image, ImageOps
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "notification_thumbs")  # type: ignore
+
+# Notification icons are shown at 42 px; decode at 2x for HiDPI outputs
+THUMBNAIL_SIZE = 42 * 2
+
+# Screenshot previews are cropped to a quarter of 1080p
+PREVIEW_WIDTH = 1920 // 4
+PREVIEW_HEIGHT = 1080 // 4
+
+# Least recently used thumbnails are removed beyond this size
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+# Decoded screenshot previews (~0.5 MB each) kept in memory
+MAX_PREVIEWS = 8
+
+# Leftover temporary files older than this are pruned like thumbnails
+STALE_TEMP_AGE = 3600  # s
+
+# Source paths whose thumbnail location is remembered in memory
+MAX_RESOLVED = 256
+
+
+def _fingerprint(path: str) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _render_thumbnail(source: str) -> str:
+    """
+    Decode ``source`` at thumbnail size, center-crop it and save it as PNG to
+    a temporary file in ``THUMBNAIL_DIR``, whose path is returned.
+    """
+    with Image.open(source) as img:
+        # Lets JPEG decode directly at a reduced scale
+        img.draft("RGB", (THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        thumb = ImageOps.fit(
+            img, (THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS
+        )
+
+    fd, temp_path = tempfile.mkstemp(dir=THUMBNAIL_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            thumb.save(f, "PNG")
+    except Exception:
+        os.unlink(temp_path)
+        raise
+    return temp_path
+
+
+class ThumbnailCache(BaseService):
+    """
+    Square notification thumbnails, generated in a worker thread.
+
+    Thumbnails are keyed by a hash of the source file's content, so the same
+    image sent repeatedly is decoded once. The cache directory is kept below
+    ``MAX_CACHE_BYTES`` by removing the least recently used files; files are
+    renamed into place and pruned under the same lock, so pruning never sees a
+    partially written thumbnail.
+    """
+
+    def __init__(self):
+        super().__init__()
+        os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache_bytes = 0
+        # source path -> callbacks waiting for its thumbnail
+        self._pending: dict[str, list[Callable[[str], None]]] = {}
+        # (source path, mtime) -> thumbnail path, least recently used first
+        self._resolved: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+        utils.ThreadTask(self._prune, self.__forget).run()
+
+    def request(self, source: str, callback: Callable[[str], None]) -> None:
+        """
+        Call ``callback`` on the main loop with the thumbnail path for
+        ``source``, or with ``source`` itself if it cannot be thumbnailed.
+        """
+        try:
+            key = (source, os.stat(source).st_mtime_ns)
+        except OSError:
+            callback(source)
+            return
+
+        thumbnail = self._resolved.get(key)
+        if thumbnail and os.path.exists(thumbnail):
+            self._resolved.move_to_end(key)
+            callback(thumbnail)
+            return
+
+        if source in self._pending:
+            self._pending[source].append(callback)
+            return
+        self._pending[source] = [callback]
+
+        utils.ThreadTask(
+            lambda: self._generate(source),
+            lambda result: self.__on_generated(key, result),
+        ).run()
+
+    def __on_generated(
+        self, key: tuple[str, int], result: tuple[str, set[str]]
+    ) -> None:
+        thumbnail, removed = result
+        self.__forget(removed)
+        if thumbnail != key[0]:
+            self._resolved[key] = thumbnail
+            self._resolved.move_to_end(key)
+            while len(self._resolved) > MAX_RESOLVED:
+                self._resolved.popitem(last=False)
+        for callback in self._pending.pop(key[0], []):
+            callback(thumbnail)
+
+    def __forget(self, removed: set[str]) -> None:
+        """Drop resolved entries whose thumbnail was pruned"""
+        if removed:
+            for key in [k for k, path in self._resolved.items() if path in removed]:
+                del self._resolved[key]
+
+    def _generate(self, source: str) -> tuple[str, set[str]]:
+        """Return the thumbnail path (or ``source``) and the pruned paths"""
+        try:
+            target = os.path.join(THUMBNAIL_DIR, f"{_fingerprint(source)}.png")
+            with self._lock:
+                if os.path.exists(target):
+                    # Refresh the LRU position
+                    os.utime(target)
+                    return target, set()
+
+            temp_path = _render_thumbnail(source)
+            with self._lock:
+                os.replace(temp_path, target)
+                self._cache_bytes += os.path.getsize(target)
+                over_limit = self._cache_bytes > MAX_CACHE_BYTES
+        except Exception as e:
+            print(f"Error creating notification thumbnail for {source}: {e}")
+            return source, set()
+
+        if over_limit:
+            # The new thumbnail is the most recently used, pruning keeps it
+            return target, self._prune()
+        return target, set()
+
+    def _prune(self) -> set[str]:
+        """Remove least recently used thumbnails, returning their paths"""
+        removed = set()
+        with self._lock:
+            entries = []
+            stale_temp = time.time() - STALE_TEMP_AGE
+            for entry in os.scandir(THUMBNAIL_DIR):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                # Recent temporary files belong to renders that are still running
+                if entry.name.endswith(".tmp") and stat.st_mtime > stale_temp:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            # Drop down to 3/4 of the limit so pruning does not run on every write
+            for _, size, path in sorted(entries):
+                if total <= MAX_CACHE_BYTES * 3 // 4:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                    removed.add(path)
+                except OSError:
+                    pass
+
+            self._cache_bytes = total
+        return removed
+
+
+def _load_preview(path: str) -> GdkPixbuf.Pixbuf:
+    """Decode ``path`` just large enough to cover the preview, then crop it"""
+    _, width, height = GdkPixbuf.Pixbuf.get_file_info(path)
+    if not width or not height:
+        raise ValueError("unsupported image")
+
+    scale = max(PREVIEW_WIDTH / width, PREVIEW_HEIGHT / height)
+    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+        path,
+        max(PREVIEW_WIDTH, round(width * scale)),
+        max(PREVIEW_HEIGHT, round(height * scale)),
+        True,
+    )
+    return utils.crop_pixbuf(pixbuf, PREVIEW_WIDTH, PREVIEW_HEIGHT)
+
+
+class ScreenshotPreviewCache(BaseService):
+    """
+    Screenshot previews shared by every view of a notification.
+
+    The screenshot is decoded at preview size in a worker thread. The
+    ``MAX_PREVIEWS`` most recently used textures are kept, and a texture is
+    dropped as soon as its notification is closed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # notification id -> texture, least recently used first
+        self._textures: OrderedDict[int, Gdk.Texture | None] = OrderedDict()
+        # Notifications whose "closed" signal is already connected
+        self._watched: set[int] = set()
+        self._pending: dict[int, list[Callable[[Gdk.Texture | None], None]]] = {}
+
+    def request(
+        self,
+        notification: Notification,
+        callback: Callable[[Gdk.Texture | None], None],
+    ) -> None:
+        """
+        Call ``callback`` on the main loop with the preview texture for
+        ``notification``, or with None if the screenshot cannot be loaded.
+        """
+        key = notification.id
+        if key in self._textures:
+            self._textures.move_to_end(key)
+            callback(self._textures[key])
+            return
+
+        if key in self._pending:
+            self._pending[key].append(callback)
+            return
+        self._pending[key] = [callback]
+
+        if key not in self._watched:
+            self._watched.add(key)
+            notification.connect("closed", lambda *_: self._evict(key))
+        path = notification.icon.removeprefix("file://")
+        utils.ThreadTask(
+            lambda: self._decode(path),
+            lambda pixbuf: self.__on_decoded(key, pixbuf),
+        ).run()
+
+    def _decode(self, path: str) -> GdkPixbuf.Pixbuf | None:
+        try:
+            return _load_preview(path)
+        except Exception as e:
+            print(f"Error loading screenshot preview {path}: {e}")
+            return None
+
+    def __on_decoded(self, key: int, pixbuf: GdkPixbuf.Pixbuf | None) -> None:
+        callbacks = self._pending.pop(key, None)
+        if callbacks is None:
+            # Closed while decoding
+            return
+
+        texture = Gdk.Texture.new_for_pixbuf(pixbuf) if pixbuf else None
+        self._textures[key] = texture
+        while len(self._textures) > MAX_PREVIEWS:
+            self._textures.popitem(last=False)
+        for callback in callbacks:
+            callback(texture)
+
+    def _evict(self, key: int) -> None:
+        self._watched.discard(key)
+        self._textures.pop(key, None)
+        self._pending.pop(key, None)
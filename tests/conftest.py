@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the config's top-level packages (services, modules, ...) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,242 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("ignis")
+
+from gi.repository import GObject  # noqa: E402
+
+from services import weather  # noqa: E402
+
+LOCATION = {"status": "success", "lat": 52.5, "lon": 13.4, "city": "Berlin"}
+FORECAST = {"current": {"temperature_2m": 21.5, "weather_code": 0}}
+
+
+class FakeNetworkMonitor(GObject.Object):
+    __gsignals__ = {
+        "network-changed": (GObject.SignalFlags.RUN_FIRST, None, (bool,)),
+    }
+
+    def __init__(self, available: bool):
+        super().__init__()
+        self._available = available
+
+    def get_network_available(self) -> bool:
+        return self._available
+
+    def set_available(self, available: bool) -> None:
+        self._available = available
+        self.emit("network-changed", available)
+
+
+class FakeSleepMonitor(GObject.Object):
+    __gsignals__ = {"resumed": (GObject.SignalFlags.RUN_FIRST, None, ())}
+
+
+class FakeThreadTask:
+    """Queues work instead of starting a thread; tests finish it explicitly"""
+
+    started: list["FakeThreadTask"] = []
+
+    def __init__(self, target, callback):
+        self._target = target
+        self._callback = callback
+
+    def run(self) -> None:
+        FakeThreadTask.started.append(self)
+
+    def finish(self) -> None:
+        self._callback(self._target())
+
+
+class FakeTimeout:
+    created: list["FakeTimeout"] = []
+
+    def __init__(self, ms, target, *args):
+        self.ms = ms
+        self.cancelled = False
+        FakeTimeout.created.append(self)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class StubWeatherServer:
+    """Serves LOCATION and FORECAST on 127.0.0.1, or errors when ``failing``"""
+
+    def __init__(self):
+        self.failing = False
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                if stub.failing:
+                    self.send_error(500)
+                    return
+                body = LOCATION if self.path.startswith("/location") else FORECAST
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def make_service(monkeypatch, tmp_path):
+    FakeThreadTask.started = []
+    FakeTimeout.created = []
+    monkeypatch.setattr(weather.utils, "ThreadTask", FakeThreadTask)
+    monkeypatch.setattr(weather.utils, "Timeout", FakeTimeout)
+    # No jitter, so backoff delays are exact
+    monkeypatch.setattr(weather.random, "uniform", lambda low, high: high)
+
+    def make(location_api: str, weather_api: str, online: bool = False):
+        network = FakeNetworkMonitor(available=online)
+        sleep = FakeSleepMonitor()
+        service = weather.WeatherService(
+            location_api=location_api,
+            weather_api=weather_api,
+            cache_dir=tmp_path,
+            network_monitor=network,
+            sleep_monitor=sleep,
+        )
+        return service, network, sleep
+
+    return make
+
+
+@pytest.fixture
+def service(make_service, monkeypatch):
+    monkeypatch.setattr(
+        weather,
+        "fetch_api",
+        lambda url, timeout=10: LOCATION if url.startswith("loc") else FORECAST,
+    )
+    return make_service("loc://", "forecast://")
+
+
+@pytest.fixture
+def stub_server():
+    server = StubWeatherServer()
+    yield server
+    server.close()
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_offline_online_resume_fetches_once_each(service):
+    service, network, sleep = service
+
+    # Offline at startup: nothing is fetched
+    assert not service.online
+    assert FakeThreadTask.started == []
+
+    # Reconnect starts exactly one fetch
+    network.set_available(True)
+    assert service.online
+    assert len(FakeThreadTask.started) == 1
+    FakeThreadTask.started[-1].finish()
+    assert service.text == "21.5°C"
+
+    # A network-changed that keeps us online does not refetch
+    network.set_available(True)
+    assert len(FakeThreadTask.started) == 1
+
+    # Going offline cancels the scheduled refresh without fetching
+    network.set_available(False)
+    assert not service.online
+    assert len(FakeThreadTask.started) == 1
+
+    network.set_available(True)
+    assert len(FakeThreadTask.started) == 2
+    FakeThreadTask.started[-1].finish()
+
+    # Resume fetches once, even if it is signalled again while in flight
+    sleep.emit("resumed")
+    sleep.emit("resumed")
+    assert len(FakeThreadTask.started) == 3
+    FakeThreadTask.started[-1].finish()
+    assert not service.fetching
+
+
+def test_resume_while_offline_does_not_fetch(service):
+    service, network, sleep = service
+
+    sleep.emit("resumed")
+    assert FakeThreadTask.started == []
+
+
+def _fetch_once(service) -> None:
+    service.refresh()
+    FakeThreadTask.started[-1].finish()
+
+
+def test_http_success_then_errors_back_off(make_service, stub_server):
+    service, network, sleep = make_service(
+        f"{stub_server.url}/location",
+        f"{stub_server.url}/forecast",
+        online=True,
+    )
+
+    # The first fetch starts from the constructor
+    FakeThreadTask.started[-1].finish()
+    assert stub_server.requests == 2
+    assert service.text == "21.5°C"
+    assert service._failures == 0
+    assert FakeTimeout.created[-1].ms == weather.UPDATE_INTERVAL * 1000
+
+    # Expire the cached forecast so every refresh reaches the server
+    stub_server.failing = True
+    service._weather_cache._time = 0
+    _fetch_once(service)
+    assert stub_server.requests == 3
+    assert service._failures == 1
+    assert FakeTimeout.created[-1].ms == weather.BACKOFF_BASE * 1000
+
+    _fetch_once(service)
+    assert service._failures == 2
+    assert FakeTimeout.created[-1].ms == weather.BACKOFF_BASE * 2 * 1000
+
+    # Recovery resets the failure counter and the regular interval
+    stub_server.failing = False
+    _fetch_once(service)
+    assert service._failures == 0
+    assert FakeTimeout.created[-1].ms == weather.UPDATE_INTERVAL * 1000
+
+
+def test_unreachable_server_backs_off(make_service):
+    url = f"http://127.0.0.1:{_unused_port()}"
+    service, network, sleep = make_service(f"{url}/location", f"{url}/forecast")
+
+    network.set_available(True)
+    FakeThreadTask.started[-1].finish()
+    assert service.text == "Error"
+    assert service._failures == 1
+    first_delay = FakeTimeout.created[-1].ms
+
+    _fetch_once(service)
+    assert service._failures == 2
+    assert FakeTimeout.created[-1].ms == first_delay * 2
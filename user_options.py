@@ -47,6 +47,11 @@ class UserOptions(OptionsManager):
     class Material(OptionsGroup):
         dark_mode: bool = True
         blur_enabled: bool = True
+        # Also write the blur source line to hyprland.conf so it survives restarts
+        persist_hyprland_config: bool = False
+        # Apply border colors to Hyprland over IPC; this overrides the user's
+        # own hyprland.conf settings for them
+        theme_hyprland: bool = False
         color_scheme: str = "Tonal Spot"
         colors: dict[str, str] = {}
 
@@ -79,6 +84,17 @@ class UserOptions(OptionsManager):
         background_threshold: int = 10
         erode_size: int = 15
 
+    class Notifications(OptionsGroup):
+        # -1 follows the focused monitor
+        popup_monitor: int = -1
+        mirror_popups: bool = False
+
+    class IdleInhibitor(OptionsGroup):
+        # Keep the session awake while a video player is playing
+        auto_media: bool = False
+        # Keep the session awake while the active window is fullscreen
+        auto_fullscreen: bool = False
+
     class Default(OptionsGroup):
         screenshot_app: list[str] = TrackedList()
 
@@ -91,6 +107,8 @@ class UserOptions(OptionsManager):
     desktop_widgets = DesktopWidgets()
     wallpaper = Wallpaper()
     rembg = Rembg()
+    notifications = Notifications()
+    idle_inhibitor = IdleInhibitor()
 
 
 user_options = UserOptions()